@@ -1,80 +1,107 @@
 import streamlit as st
+import atexit
 import time
 from pathlib import Path
 
 import multiprocessing
-import concurrent.futures
 import cProfile
 import io
 import pstats
+from functools import partial
+from itertools import chain
 import matplotlib.pyplot as plt
 
-# ------------------------------- FIBONACCI FUNCTIONS -------------------------------
-
-# Naive Fibonacci (Recursive)
-def fibonacci_recursive(n):
-    if n <= 1:
-        return n
-    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
-
-# Optimized Fibonacci using dynamic programming
-def fibonacci_dynamic(n):
-    fib = [0, 1]
-    for i in range(2, n+1):
-        fib.append(fib[i-1] + fib[i-2])
-    return fib[n]
-
-# Worker function for parallel Fibonacci
-def fib_worker_task(task_range):
-    start, end = task_range
-    result = []
-    a, b = 0, 1
-    for i in range(end):
-        if i >= start:
-            result.append(a)
-        a, b = b, a + b
-    return result
+from benchmark import benchmark, significantly_faster
+from complexity import fit_complexity, fitted_times, scaling_sweep
+from fibonacci import FIB_RESULT_MODES, FIBONACCI_ALGORITHMS, fibonacci_recursive, fibonacci_dynamic, fibonacci_fast, parallel_fibonacci
+from memory_profile import profile_memory
+from parallel_profile import ParallelProfile, hot_functions, measure_bytes_moved
+from graph import FIBO_ALGORITHM, SIEVE_ALGORITHM, describe_findings, plot_interpreter_times
+from interpreter_bench import RESULTS_FILE, load_records
+from jobs import Job
+from number_theory import is_prime, next_prime, prime_pi
+from prime_index import open_prime_index
+from scheduler import SCHEDULES, ChunkScheduler
+from result_cache import ResultCache, cached_fibonacci_sequence, cached_prime_page
+from shared_arrays import TRANSPORTS
+from sieve import SIEVE_BACKENDS, iter_primes, parallel_iter_primes, sieve_of_eratosthenes, parallel_sieve, segmented_sieve
+from worker_pool import WorkerPool
+
+# ------------------------------- WORKER POOL -------------------------------
+
+@st.cache_resource
+def get_worker_pool():
+    """
+    Warm process pools shared by every session and rerun, shut down when the server exits.
+    """
+    pool = WorkerPool()
+    atexit.register(pool.shutdown)
+    return pool
+
+# ------------------------------- RESULT CACHE -------------------------------
+
+@st.cache_resource
+def get_result_cache():
+    """
+    Results shared across reruns: 256 MiB in memory, and up to 1 GiB pickled under .cache/results.
+    """
+    return ResultCache(max_bytes=256 * 2**20, directory=Path(".cache") / "results", max_disk_bytes=2**30)
+
+# ------------------------------- PRIME INDEX -------------------------------
+
+PRIME_INDEX_PATH = Path(".cache") / "prime_index.bin"
+PRIME_INDEX_MIN_LIMIT = 1000000
+PRIME_INDEX_MAX_LIMIT = 1000000000
+
+@st.cache_resource
+def _open_prime_index(limit):
+    PRIME_INDEX_PATH.parent.mkdir(exist_ok=True)
+    return open_prime_index(PRIME_INDEX_PATH, limit, multiprocessing.cpu_count())
+
+def load_prime_index(n):
+    """
+    Return a prime index covering n, growing the on-disk index by powers of ten.
+    """
+    limit = PRIME_INDEX_MIN_LIMIT
+    while limit < n:
+        limit *= 10
+    return _open_prime_index(limit)
+
+# ------------------------------- PRIME STREAMING -------------------------------
 
-# Parallelized Fibonacci Sequence
-def parallel_fibonacci(n, workers=2):
-    chunk_size = n // workers
-    ranges = [(i * chunk_size, (i + 1) * chunk_size) for i in range(workers)]
-    if ranges[-1][1] < n:
-        ranges[-1] = (ranges[-1][0], n)
-
-    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
-        results = list(executor.map(fib_worker_task, ranges))
-    return [item for sublist in results for item in sublist]
-
-# ------------------------------- SIEVE OF ERATOSTHENES FUNCTIONS -------------------------------
-
-# Normal Sieve of Eratosthenes
-def sieve_of_eratosthenes(limit):
-    primes = [True] * (limit + 1)
-    p = 2
-    while p * p <= limit:
-        if primes[p]:
-            for i in range(p * p, limit + 1, p):
-                primes[i] = False
-        p += 1
-    return [p for p in range(2, limit + 1) if primes[p]]
-
-# Worker function for parallel Sieve
-def sieve_worker_task(task_range):
-    start, end = task_range
-    primes = sieve_of_eratosthenes(end)
-    return [p for p in primes if p >= start]
-
-# Parallelized Sieve of Eratosthenes
-def parallel_sieve(limit, workers=2):
-    chunk_size = limit // workers
-    ranges = [(i * chunk_size, (i + 1) * chunk_size) for i in range(workers)]
-    if ranges[-1][1] < limit:
-        ranges[-1] = (ranges[-1][0], limit)
-
-    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
-        results = list(executor.map(sieve_worker_task, ranges))
-    return [prime for sublist in results for prime in sublist]
+# Primes shown per page of the prime table
+PRIMES_PER_PAGE = 100
+
+# Primes counted between updates of the running count
+PRIME_STATUS_INTERVAL = 100000
+
+def show_prime_summary(limit, primes):
+    """
+    Count the primes up to limit as they stream in, updating a running count instead of building a list.
+    """
+    status = st.empty()
+    count = 0
+    largest = None
+    for largest in primes:
+        count += 1
+        if count % PRIME_STATUS_INTERVAL == 0:
+            status.write(f"Primes found so far: {count} (largest {largest})")
+    status.write(f"Number of primes up to {limit}: {count}. Largest prime: {largest}.")
+    return count
+
+def browse_primes(limit):
+    """
+    Show one page of the primes up to limit, sieving only from the page's first number onwards.
+
+    Every rerun shows the page again, so it comes from the result cache, sliced
+    from the same page for a larger limit when one was browsed before.
+    """
+    st.subheader("Browse Primes")
+    first = st.number_input("Show primes starting from:", min_value=2, max_value=max(2, limit), value=2)
+    page = cached_prime_page(get_result_cache(), first, limit, PRIMES_PER_PAGE + 1)
+    st.table({"Prime Numbers": page[:PRIMES_PER_PAGE]})
+    if len(page) > PRIMES_PER_PAGE:
+        st.write(f"The next page starts at {page[-1]}.")
 
 # ------------------------------- PERFORMANCE COMPARISON -------------------------------
 
@@ -92,6 +119,113 @@ def run_with_cprofile(func, *args):
     st.text(s.getvalue())
     return result
 
+def benchmark_settings():
+    """
+    Let the user choose how measurements are repeated, returned as keyword arguments for benchmark().
+    """
+    with st.expander("Benchmark settings"):
+        warmup = st.number_input("Untimed warm-up runs:", min_value=0, max_value=10, value=1)
+        repeat = st.number_input("Timed runs per measurement:", min_value=1, max_value=50, value=5)
+        disable_gc = st.checkbox("Disable garbage collection while timing", value=True)
+    return {"warmup": warmup, "repeat": repeat, "disable_gc": disable_gc}
+
+def show_benchmark_comparison(timings, labels, xlabel, title):
+    """
+    Display benchmark results as a statistics table and a bar chart of medians with IQR error bars.
+    """
+    st.table([timing.summary() for timing in timings])
+    medians = [timing.median for timing in timings]
+    lower = [timing.median - timing.iqr[0] for timing in timings]
+    upper = [timing.iqr[1] - timing.median for timing in timings]
+    fig, ax = plt.subplots()
+    ax.bar([str(label) for label in labels], medians, yerr=[lower, upper], capsize=6,
+           color=['blue', 'green', 'orange', 'red'][:len(timings)])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Median Execution Time (seconds)')
+    ax.set_title(title)
+    st.pyplot(fig)
+
+def run_with_worker_profiles(func, *args):
+    """
+    Run a parallel function with cProfile inside every worker process and display
+    per-worker and combined hot functions plus the time spent moving tasks and results.
+    """
+    profile = ParallelProfile()
+    result = func(*args, profile=profile)
+    for pid, stats in sorted(profile.per_worker.items()):
+        st.write(f"Hot functions in worker process {pid}:")
+        st.table(hot_functions(stats))
+    st.write("Hot functions combined across all workers:")
+    st.table(hot_functions(profile.combined()))
+    st.write("Time per task (dispatch and return include IPC and serialization):")
+    st.table(profile.tasks)
+    summary = profile.ipc_summary()
+    st.table({"Phase": list(summary), "Total Time (seconds)": [f"{t:.6f}" for t in summary.values()]})
+    return result
+
+def run_with_memprofile(func, *args, parallel=False):
+    """
+    Run a function under tracemalloc and display its peak memory and top allocation sites,
+    plus the peak RSS and traced peak of every worker task for parallel runs.
+    """
+    result, profile = profile_memory(func, *args, parallel=parallel)
+    st.table([profile.summary()])
+    st.write("Top allocation sites at the peak of the run:")
+    st.table(profile.sites)
+    if parallel:
+        st.write("Memory per task in the worker processes:")
+        st.table(profile.tasks)
+    return result, profile
+
+def memory_profiling_setting():
+    """
+    Let the user choose whether runs are repeated once more under the memory profiler.
+    """
+    return st.checkbox("Profile memory", value=True,
+                       help="Repeat each run once under tracemalloc, separately from the timed runs, to record its "
+                            "peak memory and top allocation sites, and the peak RSS of worker processes.")
+
+def show_memory_comparison(profiles, labels, xlabel, title):
+    """
+    Display memory profiles as a table and a bar chart of traced peaks and, for parallel runs, worker peak RSS.
+    """
+    st.table([{xlabel: str(label), **profile.summary()} for label, profile in zip(labels, profiles)])
+    positions = list(range(len(labels)))
+    with_workers = any(profile.worker_peak_rss is not None for profile in profiles)
+    width = 0.4 if with_workers else 0.8
+    fig, ax = plt.subplots()
+    ax.bar([x - width / 2 if with_workers else x for x in positions],
+           [profile.traced_peak / 2**20 for profile in profiles], width, color='blue', label='Traced peak (this process)')
+    if with_workers:
+        ax.bar([x + width / 2 for x in positions], [(profile.worker_peak_rss or 0) / 2**20 for profile in profiles],
+               width, color='orange', label='Peak RSS (largest worker)')
+    ax.set_xticks(positions)
+    ax.set_xticklabels([str(label) for label in labels])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Peak Memory (MiB)')
+    ax.set_title(title)
+    ax.legend()
+    st.pyplot(fig)
+
+def show_worker_utilization(scheduler, title):
+    """
+    Display the busy share of every worker and a timeline of the tasks each one ran.
+    """
+    rows = scheduler.worker_utilization()
+    st.write(f"{len(scheduler.tasks)} tasks in {scheduler.wall_time:.4f} seconds.")
+    st.table([{**row, "Busy (s)": f"{row['Busy (s)']:.4f}", "Utilization": f"{row['Utilization']:.0%}"} for row in rows])
+    fig, ax = plt.subplots()
+    for y, row in enumerate(rows):
+        spans = [(task["Started (s)"], task["Compute (s)"]) for task in scheduler.tasks
+                 if task["Worker PID"] == row["Worker PID"]]
+        ax.broken_barh(spans, (y - 0.4, 0.8), facecolors='blue', edgecolor='white')
+    ax.set_yticks(range(len(rows)))
+    ax.set_yticklabels([str(row["Worker PID"]) for row in rows])
+    ax.set_xlabel('Time Since the Run Started (seconds)')
+    ax.set_ylabel('Worker PID')
+    ax.set_title(title)
+    st.pyplot(fig)
+
 def performance_comparison():
     """
     Performance comparison for Fibonacci and Prime Number tasks, with profiling and image display.
@@ -100,8 +234,10 @@ def performance_comparison():
     st.write("""
         This section compares the performance of two algorithms: the Fibonacci sequence and the Sieve of Eratosthenes.
         We run each function with **cProfile**, a built-in Python module, to capture profiling statistics such as execution time and function calls.
+        Execution times are measured in separate runs without profiling, repeated several times and reported as a median with its spread.
         After running the test, we display profiling statistics to help understand how the algorithm performs across different environments (PyPy, CPython, Nuitka, Anaconda).
         Additionally, performance comparison graphs are generated to visually compare execution times.
+        The graphs and findings come from `interpreter_bench.py`, which times the algorithms under each installed interpreter; `graph.py` redraws the charts from its results file.
     """)
     # Add a paragraph about flavors being worked with
     st.write("""
@@ -126,7 +262,9 @@ def performance_comparison():
             "fibonacci/fibonacci_implementation4.png",
             "fibonacci/fibonacci_implementation5.png"
         ]
-        graph_image = "fibonacci/fibo_graph.png"  # Graph for Fibonacci execution time comparison
+        implementations = st.multiselect("Fibonacci implementations to compare:", ["Dynamic Programming", "Fast Doubling"],
+                                         default=["Dynamic Programming", "Fast Doubling"])
+        compare_n = st.number_input("Enter n for the implementation comparison:", min_value=10, max_value=1000000, value=100000)
     else:
         n = st.number_input("Enter the limit for Prime Numbers:", min_value=10, max_value=15, value=10)
         image_files = [
@@ -136,26 +274,56 @@ def performance_comparison():
             "sieve/sieve_implementation3.png",
             "sieve/sieve_implementation5.png"
         ]
-        graph_image = "sieve/sieve_graph.png"  # Graph for Sieve execution time comparison
+        backends = st.multiselect("Sieve backends to compare:", list(SIEVE_BACKENDS), default=list(SIEVE_BACKENDS))
+        backend_limit = st.number_input("Enter the limit for the backend comparison:", min_value=10, max_value=100000000, value=1000000)
+
+    memory_profiling = memory_profiling_setting()
+    settings = benchmark_settings()
 
     if st.button("Run Test"):
         st.write(f"Running {task}...")
-        start = time.time()
 
-        # Run task with profiling
+        # Time the task on its own, then profile it in a separate, untimed run
         if task == "Fibonacci Sequence":
+            timing = benchmark(fibonacci_dynamic, n, algorithm="Dynamic Programming Fibonacci", n=n, **settings)
             result = run_with_cprofile(fibonacci_dynamic, n)
             st.write(f"Fibonacci Number F({n}) = {result}")
-            # Display table of Fibonacci numbers
-            st.table({"Index": list(range(n + 1)), "Fibonacci Numbers": [fibonacci_dynamic(i) for i in range(n + 1)]})
+            # Display table of Fibonacci numbers, built once in O(n) and reused from the cache
+            st.table({"Index": list(range(n + 1)), "Fibonacci Numbers": cached_fibonacci_sequence(get_result_cache(), n)})
         else:
-            result = run_with_cprofile(sieve_of_eratosthenes, n)
-            st.write(f"Number of primes up to {n}: {len(result)}")
-            # Display table of prime numbers
-            st.table({"Prime Numbers": result})
-        
-        end = time.time()
-        st.write(f"Execution Time: {end - start:.4f} seconds")
+            timing = benchmark(sieve_of_eratosthenes, n, algorithm="Sieve of Eratosthenes", backend="python", n=n, **settings)
+            run_with_cprofile(sieve_of_eratosthenes, n)
+            # Count the primes from the streaming sieve instead of holding the whole list for a table
+            show_prime_summary(n, iter_primes(2, n + 1))
+
+        st.write(f"Execution Time (median of {len(timing.samples)} runs): {timing.median:.6f} seconds")
+        st.table([timing.summary()])
+        if memory_profiling:
+            st.write("Memory profile:")
+            run_with_memprofile(fibonacci_dynamic if task == "Fibonacci Sequence" else sieve_of_eratosthenes, n)
+
+        # Benchmark every selected Fibonacci implementation on the same n
+        if task == "Fibonacci Sequence" and implementations:
+            st.subheader(f"Fibonacci Implementation Comparison (n={compare_n})")
+            timings = [benchmark(FIBONACCI_ALGORITHMS[name], compare_n, algorithm=f"{name} Fibonacci", n=compare_n, **settings)
+                       for name in implementations]
+            show_benchmark_comparison(timings, implementations, 'Implementation',
+                                      f'Fibonacci Implementation Comparison (n={compare_n})')
+            if memory_profiling:
+                profiles = [profile_memory(FIBONACCI_ALGORITHMS[name], compare_n)[1] for name in implementations]
+                show_memory_comparison(profiles, implementations, 'Implementation',
+                                       f'Fibonacci Implementation Memory (n={compare_n})')
+
+        # Benchmark every selected sieve backend on the same limit
+        if task == "Sieve of Eratosthenes" and backends:
+            st.subheader(f"Sieve Backend Comparison (limit={backend_limit})")
+            timings = [benchmark(sieve_of_eratosthenes, backend_limit, backend, algorithm="Sieve of Eratosthenes",
+                                 backend=backend, n=backend_limit, **settings)
+                       for backend in backends]
+            show_benchmark_comparison(timings, backends, 'Backend', f'Sieve Backend Comparison (limit={backend_limit})')
+            if memory_profiling:
+                profiles = [profile_memory(sieve_of_eratosthenes, backend_limit, backend)[1] for backend in backends]
+                show_memory_comparison(profiles, backends, 'Backend', f'Sieve Backend Memory (limit={backend_limit})')
 
         # Display performance screenshots
         st.write("Performance Screenshots:")
@@ -166,118 +334,236 @@ def performance_comparison():
             else:
                 st.warning(f"Image not found: {img_file}")
 
-        # Display the graph comparing execution times
+        # Graph and findings are drawn from the measurements saved by interpreter_bench.py, never from fixed numbers
         st.subheader(f"{task} Execution Time Comparison Graph")  # Title above the graph
-        graph_path = image_folder / graph_image
-        if graph_path.exists():
-            st.image(str(graph_path), caption=f"{task} - Execution Time Comparison", width=600)
+        measured = []
+        if RESULTS_FILE.exists():
+            measured = load_records(RESULTS_FILE, FIBO_ALGORITHM if task == "Fibonacci Sequence" else SIEVE_ALGORITHM)
+        if measured:
+            st.pyplot(plot_interpreter_times(measured, f"{task} Execution Time Comparison"))
+            st.subheader("Findings from the Graph")
+            st.markdown(describe_findings(measured))
         else:
-            st.warning(f"Graph image not found: {graph_image}")
+            st.info("No measured results yet, so there is no graph or findings to show. Run "
+                    "`python interpreter_bench.py` with one --interpreter per environment to compare them here.")
 
-        st.subheader("Findings from the Graph")
-        if task == "Fibonacci Sequence":
-          st.write("""
-    From the graph, we observe the following:
-    - **CPython** and **Anaconda** exhibit the fastest execution times, both recording approximately 2.14e-06 seconds. 
-      This demonstrates their efficiency in handling recursive tasks like Fibonacci sequence generation.
-    - **Nuitka** is slightly slower, with an execution time of 4.05e-06 seconds. The compilation of Python to optimized C binaries contributes to its good performance.
-    - **PyPy**, despite its JIT compilation capabilities, records the slowest time of 1.14e-05 seconds for this task. 
-      The overhead of JIT compilation for a relatively small computation task may outweigh its runtime optimizations.
-
-    Overall, CPython and Anaconda are the most efficient for this Fibonacci task due to their lightweight execution, 
-    while PyPy's performance advantage is not as pronounced in this specific case.
-       """)
-        else:  # Sieve of Eratosthenes
-           st.write("""
-    From the graph, we observe the following:
-    - **PyPy** leads in performance due to JIT compilation, which excels in loop-heavy algorithms like the Sieve of Eratosthenes.
-    - **Anaconda** performs well, with the second-fastest time of 0.0051 seconds, benefiting from optimized libraries.
-    - **Nuitka**, while slightly slower than Anaconda, demonstrates good performance with a time of 0.0057 seconds due to its compiled nature.
-    - **CPython** shows the slowest execution time of 0.0063 seconds, as it lacks runtime or compilation-based optimizations.
-
-    The efficiency of PyPy's JIT compilation in handling array-based operations makes it ideal for tasks like prime number generation using the Sieve of Eratosthenes.
-        """)
+    if task == "Sieve of Eratosthenes":
+        browse_primes(n)
+        prime_index_lookup()
+
+def prime_index_lookup():
+    """
+    Answer "is n prime?" and "how many primes <= n?" from the persistent prime index.
+    """
+    st.subheader("Prime Index Lookup")
+    st.write("""
+        These answers come from an odd-only prime bitmap that is sieved once, saved to disk and memory-mapped,
+        so a lookup is a bit test and a prime count is a checkpoint plus a short popcount instead of a fresh sieve.
+    """)
+    query = st.number_input("Enter a number to look up:", min_value=0, max_value=PRIME_INDEX_MAX_LIMIT, value=97)
+    index = load_prime_index(query)
+    verdict = "is prime" if index.is_prime(query) else "is not prime"
+    st.write(f"{query} {verdict}. There are {index.prime_count(query)} primes up to {query}.")
 
 # ------------------------------- PARALLELIZATION SECTION -------------------------------
+
+# Largest sequence shown as a table; longer ones only show their first rows
+MAX_TABLE_ROWS = 100
+
+def show_fibonacci_result(result, n, mode):
+    """
+    Display what parallel_fibonacci returned for the selected result mode.
+    """
+    if mode == "last":
+        st.write(f"F({n - 1}) has {result.bit_length()} bits.")
+    elif mode == "checksum":
+        st.write(f"Checksum of F(0)..F({n - 1}) modulo 2^64: {result}")
+    else:
+        st.write(f"Generated {len(result)} Fibonacci numbers.")
+        rows = result[:MAX_TABLE_ROWS]
+        if len(result) > MAX_TABLE_ROWS:
+            st.write(f"Showing the first {MAX_TABLE_ROWS}.")
+        # Shown as text: Arrow cannot hold integers wider than 64 bits
+        st.table({"Index": list(range(len(rows))), "Fibonacci Numbers": [str(value) for value in rows]})
 def parallelization_section():
     st.header("Parallelization")
     task = st.selectbox("Choose the algorithm:", ["Fibonacci Sequence", "Sieve of Eratosthenes"])
     
     if task == "Fibonacci Sequence":
-        n = st.number_input("Enter the limit for Fibonacci:", min_value=10, max_value=15, value=10)
+        n = st.number_input("Enter the limit for Fibonacci:", min_value=10, max_value=50000, value=10)
+        mode = st.selectbox("Result returned by each worker:", list(FIB_RESULT_MODES))
+        mod = None
+        if mode == "mod":
+            mod = st.number_input("Enter the modulus:", min_value=2, max_value=10**15, value=1000000007)
     else:
         n = st.number_input("Enter the limit for Prime Numbers:", min_value=10, max_value=15, value=10)
 
     workers = st.slider("Select the number of parallel workers:", 1, multiprocessing.cpu_count(), 2)
+    profile_workers = st.checkbox("Profile inside the worker processes", value=True,
+                                  help="Each worker runs cProfile on its own task and sends the stats back, "
+                                       "instead of profiling only the parent process waiting on the pool.")
+    transport = st.selectbox("How workers return their results:", list(TRANSPORTS),
+                             help="\"pickle\" sends each worker's list back through the pool's pipes; "
+                                  "\"shared_memory\" has the workers write into an array the parent allocated.")
+    schedule = st.selectbox("How the range is split into tasks:", list(SCHEDULES),
+                            help="\"static\" gives every worker one equal chunk; \"adaptive\" feeds many smaller tasks, "
+                                 "sized from the measured cost of earlier ones, to whichever worker is free.")
+    memory_profiling = memory_profiling_setting()
+    settings = benchmark_settings()
 
     if st.button("Run Parallel Test"):
-        # Initialize lists to store execution times
-        execution_times = []
-        worker_counts = [1, workers]
-        
-        # First, run with one worker (serial execution) without profiling
-        if task == "Fibonacci Sequence":
-            st.write("Running with 1 worker (baseline)...")
-            start = time.time()
-            result = parallel_fibonacci(n, 1)  # Using 1 worker
-            st.write(f"Generated {len(result)} Fibonacci numbers.")
-            st.table({"Index": list(range(len(result))), "Fibonacci Numbers": result})
-        else:
+        # Lease a warm pool before any timing so spawn and import costs are reported on
+        # their own instead of inflating the measurements; other sessions may share it
+        pool = get_worker_pool()
+        was_warm = pool.is_warm(workers)
+        with pool.lease(workers) as executor:
+            if was_warm:
+                st.write(f"Reusing the warm pool of {workers} worker processes.")
+            else:
+                st.write(f"Worker pool startup ({workers} processes, spawn + warm-up): "
+                         f"{pool.startup_times.get(workers, 0.0):.4f} seconds. "
+                         "This is not included in the execution times below.")
+
+            # Profiled runs need every task up front, so they use the static split; timed runs use the chosen schedule
+            fibonacci_run = partial(parallel_fibonacci, transport=transport)
+            sieve_run = partial(parallel_sieve, transport=transport)
+            scheduler = ChunkScheduler(schedule)
+            fibonacci_scheduled = partial(fibonacci_run, scheduler=scheduler)
+            sieve_scheduled = partial(sieve_run, scheduler=scheduler)
+            # Bytes moved are counted in a profiled run, which only matches a static split
+            count_bytes = measure_bytes_moved if schedule == "static" else (lambda *args: None)
+
+            # First, run with one worker (serial execution) without profiling
             st.write("Running with 1 worker (baseline)...")
-            start = time.time()
-            result = parallel_sieve(n, 1)  # Using 1 worker
-            st.write(f"Number of primes found: {len(result)}")
-            st.table({"Prime Numbers": result})
-        end = time.time()
-        exec_time_1_worker = end - start
-        st.write(f"Execution Time with 1 worker: {exec_time_1_worker:.4f} seconds")
-        execution_times.append(exec_time_1_worker)
-
-        # Now, run with user-selected number of workers without profiling
-        if task == "Fibonacci Sequence":
-            st.write(f"Running with {workers} workers...")
-            start = time.time()
-            result = parallel_fibonacci(n, workers)
-            st.write(f"Generated {len(result)} Fibonacci numbers.")
-            st.table({"Index": list(range(len(result))), "Fibonacci Numbers": result})
-        else:
+            if task == "Fibonacci Sequence":
+                timing_1_worker = benchmark(fibonacci_scheduled, n, 1, mode, mod, executor, algorithm="Parallel Fibonacci",
+                                            backend=f"{mode}, {transport}, {schedule}", n=n, workers=1, **settings,
+                                            bytes_moved=count_bytes(fibonacci_run, n, 1, mode, mod, executor))
+            else:
+                timing_1_worker = benchmark(sieve_scheduled, n, 1, executor, algorithm="Parallel Sieve",
+                                            backend=f"{transport}, {schedule}", n=n, workers=1, **settings,
+                                            bytes_moved=count_bytes(sieve_run, n, 1, executor))
+            st.write(f"Execution Time with 1 worker (median): {timing_1_worker.median:.4f} seconds")
+
+            # Now, run with user-selected number of workers without profiling
             st.write(f"Running with {workers} workers...")
-            start = time.time()
-            result = parallel_sieve(n, workers)
-            st.write(f"Number of primes found: {len(result)}")
-            st.table({"Prime Numbers": result})
-        end = time.time()
-        exec_time_workers = end - start
-        st.write(f"Execution Time with {workers} workers: {exec_time_workers:.4f} seconds")
-        execution_times.append(exec_time_workers)
-
-        # Plotting the execution times comparison graph before cProfile
-        fig, ax = plt.subplots()
-        ax.bar(worker_counts, execution_times, color=['blue', 'green'])
-        ax.set_xlabel('Number of Workers')
-        ax.set_ylabel('Execution Time (seconds)')
-        ax.set_title(f'Execution Time Comparison ({task})')
-        st.pyplot(fig)
-
-        # Explanation of why execution time is faster/slower with parallelization
-        st.subheader("Why the Execution Time Varies with Parallelization:")
-        if exec_time_workers < exec_time_1_worker:
-            st.write("""With parallelization, the execution time is reduced because the workload is split across multiple workers, allowing them to process different parts of the problem simultaneously. This parallel processing can significantly speed up the overall execution, especially for computationally intensive tasks like Fibonacci or prime number generation. However, the effectiveness of parallelization depends on the task, the number of available processors, and the nature of the algorithm being used. In some cases, overhead from task distribution and communication between workers can offset the gains from parallelism.""")
-        elif exec_time_workers > exec_time_1_worker:
-            st.write("""In some cases, parallelization might not lead to a speedup. This can happen if the task at hand does not lend itself well to parallel execution, or if the overhead of managing multiple workers outweighs the benefits of parallelism. For smaller tasks, the sequential execution can sometimes be more efficient than parallel execution.""")
-
-        # Profiling for 1 worker (baseline) before the user-defined worker profiling
-        st.subheader("Profiling Information for 1 Worker (Baseline):")
-        prof_1_worker = run_with_cprofile(parallel_fibonacci if task == "Fibonacci Sequence" else parallel_sieve, n, 1)
-        st.text(prof_1_worker)
-
-        # Profiling for user-defined workers
-        st.subheader(f"Profiling Information for {workers} Workers:")
-        prof_user_workers = run_with_cprofile(parallel_fibonacci if task == "Fibonacci Sequence" else parallel_sieve, n, workers)
-        st.text(prof_user_workers)
+            if task == "Fibonacci Sequence":
+                timing_workers = benchmark(fibonacci_scheduled, n, workers, mode, mod, executor, algorithm="Parallel Fibonacci",
+                                           backend=f"{mode}, {transport}, {schedule}", n=n, workers=workers, **settings,
+                                           bytes_moved=count_bytes(fibonacci_run, n, workers, mode, mod, executor))
+                result = fibonacci_run(n, workers, mode, mod, executor)
+                show_fibonacci_result(result, n, mode)
+            else:
+                timing_workers = benchmark(sieve_scheduled, n, workers, executor, algorithm="Parallel Sieve",
+                                           backend=f"{transport}, {schedule}", n=n, workers=workers, **settings,
+                                           bytes_moved=count_bytes(sieve_run, n, workers, executor))
+                # Counted from segments streamed back in order by the warm pool, never held as one list
+                show_prime_summary(n, chain.from_iterable(parallel_iter_primes(2, n + 1, workers, executor=executor)))
+            st.write(f"Execution Time with {workers} workers (median): {timing_workers.median:.4f} seconds")
+            if schedule == "static":
+                st.write(f"Bytes moved between processes per run: {timing_1_worker.bytes_moved} with 1 worker, "
+                         f"{timing_workers.bytes_moved} with {workers} workers.")
+
+            # Plotting the execution times comparison graph before cProfile
+            show_benchmark_comparison([timing_1_worker, timing_workers], ["1", str(workers)], 'Number of Workers',
+                                      f'Execution Time Comparison ({task})')
+
+            # The scheduler still holds the last timed run, the one with the selected number of workers
+            st.subheader(f"Worker Utilization ({schedule} schedule, {workers} workers)")
+            show_worker_utilization(scheduler, f'Tasks per Worker ({task}, {schedule} schedule)')
+
+            # Memory of the same two configurations, parent and workers, in separate traced runs
+            if memory_profiling:
+                st.subheader("Memory Use")
+                worker_counts = [1, workers]
+                if task == "Fibonacci Sequence":
+                    profiles = [profile_memory(fibonacci_run, n, count, mode, mod, executor, parallel=True)[1]
+                                for count in worker_counts]
+                else:
+                    profiles = [profile_memory(sieve_run, n, count, executor, parallel=True)[1] for count in worker_counts]
+                show_memory_comparison(profiles, worker_counts, 'Number of Workers', f'Peak Memory Comparison ({task})')
+                st.write(f"Memory per task with {workers} workers:")
+                st.table(profiles[-1].tasks)
+
+            # Explanation of why execution time is faster/slower with parallelization, decided on
+            # non-overlapping confidence intervals rather than a single noisy sample
+            st.subheader("Why the Execution Time Varies with Parallelization:")
+            if significantly_faster(timing_workers, timing_1_worker):
+                st.write("""With parallelization, the execution time is reduced because the workload is split across multiple workers, allowing them to process different parts of the problem simultaneously. This parallel processing can significantly speed up the overall execution, especially for computationally intensive tasks like Fibonacci or prime number generation. However, the effectiveness of parallelization depends on the task, the number of available processors, and the nature of the algorithm being used. In some cases, overhead from task distribution and communication between workers can offset the gains from parallelism.""")
+            elif significantly_faster(timing_1_worker, timing_workers):
+                st.write("""In some cases, parallelization might not lead to a speedup. This can happen if the task at hand does not lend itself well to parallel execution, or if the overhead of managing multiple workers outweighs the benefits of parallelism. For smaller tasks, the sequential execution can sometimes be more efficient than parallel execution.""")
+            else:
+                st.write("""The 95% confidence intervals of the two medians overlap, so the difference is within run-to-run noise and neither configuration is measurably faster at this size. Increase the limit or the number of timed runs in the benchmark settings to separate them.""")
+
+            # Profiling for 1 worker (baseline) before the user-defined worker profiling
+            profiler = run_with_worker_profiles if profile_workers else run_with_cprofile
+            st.subheader("Profiling Information for 1 Worker (Baseline):")
+            if task == "Fibonacci Sequence":
+                profiler(fibonacci_run, n, 1, mode, mod, executor)
+            else:
+                profiler(sieve_run, n, 1, executor)
+
+            # Profiling for user-defined workers
+            st.subheader(f"Profiling Information for {workers} Workers:")
+            if task == "Fibonacci Sequence":
+                profiler(fibonacci_run, n, workers, mode, mod, executor)
+            else:
+                profiler(sieve_run, n, workers, executor)
+
+    if task == "Sieve of Eratosthenes":
+        browse_primes(n)
 
 # ------------------------------- BIG O ANALYSIS -------------------------------
 
+# Streamlit number inputs are JavaScript numbers, exact only up to 2^53 - 1
+MAX_SAFE_INTEGER = 2**53 - 1
+
+# Largest x the prime counting button accepts: about a minute of work and O(sqrt(x)) memory
+PRIME_PI_MAX = 10**13
+
+# Algorithms available to the scaling sweep: name -> (function, extra arguments, first n, growth factor).
+# Exponential algorithms start small and grow slowly so the sweep gets several points before the budget runs out.
+SCALING_ALGORITHMS = {
+    "Fibonacci Sequence": {
+        "Recursive Fibonacci": (fibonacci_recursive, (), 5, 1.2),
+        "Dynamic Programming Fibonacci": (fibonacci_dynamic, (), 1000, 2.0),
+        "Fast Doubling Fibonacci": (fibonacci_fast, (), 1000, 2.0),
+    },
+    "Sieve of Eratosthenes": {
+        **{f"Normal Sieve ({backend})": (sieve_of_eratosthenes, (backend,), 1000, 2.0) for backend in SIEVE_BACKENDS},
+        "Prime Counting (Lucy_Hedgehog)": (prime_pi, (), 1000, 4.0),
+        "Miller-Rabin (next prime >= n)": (next_prime, (), 1000, 100.0),
+    },
+}
+
+def show_scaling_sweep(name, func, extra_args, start, factor, stop, point_budget, total_budget):
+    """
+    Run a scaling sweep, fit it against the complexity classes and plot measured vs fitted times on log-log axes.
+    """
+    ns, times, aborted_at = scaling_sweep(func, start, stop, factor, point_budget, total_budget, extra_args=extra_args)
+    if aborted_at is not None:
+        st.write(f"Stopped at n={aborted_at}: a single point took longer than the {point_budget} second budget.")
+    if len(ns) < 2:
+        st.warning("Not enough points to fit a complexity class; raise the time budget or lower the smallest n.")
+        return
+    st.write(f"Largest n measured: {ns[-1]}")
+    st.table({"n": ns, "Median Time (seconds)": [f"{t:.6f}" for t in times]})
+
+    fits = fit_complexity(ns, times)
+    st.write(f"Best fit for {name}: **{fits[0][0]}**")
+    st.table({"Complexity Class": [fit[0] for fit in fits],
+              "Residual (log space)": [f"{fit[2]:.4f}" for fit in fits]})
+
+    fig, ax = plt.subplots()
+    ax.loglog(ns, times, 'o', color='black', label='Measured')
+    for (fit_name, coefficient, _), color in zip(fits[:3], ['blue', 'green', 'orange']):
+        ax.loglog(ns, fitted_times(fit_name, coefficient, ns), '-', color=color, label=f'{fit_name} fit')
+    ax.set_xlabel('n')
+    ax.set_ylabel('Median Execution Time (seconds)')
+    ax.set_title(f'Scaling Curve ({name})')
+    ax.legend()
+    st.pyplot(fig)
+
 def big_o_analysis():
     st.header("Big O Analysis")
     task = st.selectbox("Choose the algorithm:", ["Fibonacci Sequence", "Sieve of Eratosthenes"])
@@ -285,47 +571,94 @@ def big_o_analysis():
     if task == "Fibonacci Sequence":
         st.markdown("""
         *Fibonacci Sequence Complexity*:
-        - Recursive Fibonacci: *O(2^n)*
+        - Recursive Fibonacci: *O(2^n)* (more precisely O(φ^n), φ ≈ 1.618)
         - Dynamic Programming: *O(n)*
-        - Parallelized Version: *O(n / workers)*
+        - Fast Doubling: *O(log n)* multiplications
+        - Parallelized Version: *O(n / workers)*, each worker seeds its chunk with fast doubling
         """)
     else:
         st.markdown("""
         *Sieve of Eratosthenes Complexity*:
-        - Normal Sieve: *O(n log log n)*
-        - Parallelized Sieve: *O(n log log n / workers)*
+        - Normal Sieve: *O(n log log n)* (python, bytearray and numpy backends)
+        - Parallelized Segmented Sieve: *O(n log log n / workers)*, base primes up to sqrt(n) computed once
+        - Prime Counting (Lucy_Hedgehog): *O(n^(3/4))* for pi(n) without listing the primes
+        - Miller-Rabin Primality Test: *O(log^3 n)* per number, deterministic for every 64-bit n
         """)
     
     n = st.number_input("Enter a number for analysis:", min_value=10, max_value=1000000, value=10000)
-    
+    settings = benchmark_settings()
+
+    # Each button times its algorithm on its own, then profiles it in a separate, untimed run
     if task == "Fibonacci Sequence":
         if st.button("Run Recursive Fibonacci"):
-            st.write("Running Recursive Fibonacci...")
-            start = time.time()
-            run_with_cprofile(fibonacci_recursive, 30)  # Hardcoded smaller n for recursive test
-            end = time.time()
-            st.write(f"Execution Time (Recursive, O(2^n)): {end - start:.4f} seconds")
+            st.write("Running Recursive Fibonacci, scanning upward in n until the time budget runs out...")
+            show_scaling_sweep("Recursive Fibonacci", fibonacci_recursive, (), start=5, factor=1.2, stop=None,
+                               point_budget=2.0, total_budget=20.0)
         
         if st.button("Run Dynamic Programming Fibonacci"):
             st.write("Running Dynamic Programming Fibonacci...")
-            start = time.time()
+            timing = benchmark(fibonacci_dynamic, n, algorithm="Dynamic Programming Fibonacci", n=n, **settings)
             run_with_cprofile(fibonacci_dynamic, n)
-            end = time.time()
-            st.write(f"Execution Time (Dynamic Programming, O(n)): {end - start:.4f} seconds")
+            st.write(f"Execution Time (Dynamic Programming, O(n), median of {len(timing.samples)} runs): "
+                     f"{timing.median:.6f} seconds")
+            st.table([timing.summary()])
+
+        if st.button("Run Fast Doubling Fibonacci"):
+            st.write("Running Fast Doubling Fibonacci...")
+            timing = benchmark(fibonacci_fast, n, algorithm="Fast Doubling Fibonacci", n=n, **settings)
+            run_with_cprofile(fibonacci_fast, n)
+            st.write(f"Execution Time (Fast Doubling, O(log n) multiplications, median of {len(timing.samples)} runs): "
+                     f"{timing.median:.6f} seconds")
+            st.table([timing.summary()])
     else:
         if st.button("Run Normal Sieve"):
             st.write("Running Normal Sieve...")
-            start = time.time()
+            timing = benchmark(sieve_of_eratosthenes, n, algorithm="Sieve of Eratosthenes", backend="python", n=n, **settings)
             run_with_cprofile(sieve_of_eratosthenes, n)
-            end = time.time()
-            st.write(f"Execution Time (O(n log log n)): {end - start:.4f} seconds")
+            st.write(f"Execution Time (O(n log log n), median of {len(timing.samples)} runs): {timing.median:.6f} seconds")
+            st.table([timing.summary()])
+
+        # Prime counting and Miller-Rabin reach far past any sieve, so each gets its own input
+        count_limit = st.number_input("Enter x for prime counting:", min_value=10, max_value=PRIME_PI_MAX, value=10**9)
+        candidate = st.number_input("Enter a number to test for primality:", min_value=1, max_value=MAX_SAFE_INTEGER,
+                                    value=1000000007)
+
+        if st.button("Run Prime Counting"):
+            st.write("Running Lucy_Hedgehog prime counting...")
+            timing = benchmark(prime_pi, count_limit, algorithm="Prime Counting (Lucy_Hedgehog)", n=count_limit, **settings)
+            count = run_with_cprofile(prime_pi, count_limit)
+            st.write(f"There are {count} primes up to {count_limit}.")
+            st.write(f"Execution Time (O(n^(3/4)), median of {len(timing.samples)} runs): {timing.median:.6f} seconds")
+            st.table([timing.summary()])
+
+        if st.button("Run Miller-Rabin Primality Test"):
+            st.write("Running Miller-Rabin...")
+            timing = benchmark(is_prime, candidate, algorithm="Miller-Rabin", n=candidate, **settings)
+            verdict = "is prime" if run_with_cprofile(is_prime, candidate) else "is not prime"
+            st.write(f"{candidate} {verdict}.")
+            st.write(f"Execution Time (O(log^3 n), median of {len(timing.samples)} runs): {timing.median:.6f} seconds")
+            st.table([timing.summary()])
+
+    # Sweep one algorithm over a geometric series of n and fit its growth
+    st.subheader("Scaling Curve")
+    algorithms = SCALING_ALGORITHMS[task]
+    name = st.selectbox("Algorithm to sweep:", list(algorithms))
+    func, extra_args, default_start, default_factor = algorithms[name]
+    start = st.number_input("Smallest n:", min_value=2, max_value=1000000, value=default_start)
+    stop = st.number_input("Largest n:", min_value=2, max_value=MAX_SAFE_INTEGER, value=100000000)
+    factor = st.slider("Growth factor between points:", 1.1, 4.0, default_factor)
+    point_budget = st.number_input("Time budget per point (seconds):", min_value=0.1, max_value=60.0, value=2.0)
+    total_budget = st.number_input("Total time budget (seconds):", min_value=1.0, max_value=600.0, value=30.0)
+    if st.button("Run Scaling Sweep"):
+        show_scaling_sweep(name, func, extra_args, start, factor, stop, point_budget, total_budget)
 
     if task == "Fibonacci Sequence":
             st.write("""
                 
                 The **Naive Recursive** approach has a high time complexity of O(2^n), making it significantly slower for larger values of `n`.
-                The **Dynamic Programming** approach, with a time complexity of O(n), improves performance by avoiding redundant calculations, making it much faster.
-                The **Parallel Fibonacci** approach divides the task into smaller chunks and processes them simultaneously, leading to reduced execution time when using more workers.
+                The **Dynamic Programming** approach, with a time complexity of O(n), improves performance by avoiding redundant calculations, making it much faster. Counted in bit operations it grows closer to O(n^2), because F(n) has O(n) bits and each addition touches all of them, which the scaling curve shows for large `n`.
+                The **Fast Doubling** approach computes F(2k) and F(2k+1) from F(k) and F(k+1), so it needs only O(log n) big-integer multiplications and keeps a constant number of integers alive instead of a list of all n values.
+                The **Parallel Fibonacci** approach divides the task into smaller chunks and processes them simultaneously, leading to reduced execution time when using more workers. Each worker jumps straight to the start of its chunk with fast doubling instead of iterating from F(0).
                 However, the overhead of parallelization may cause diminishing returns for smaller `n` values or when fewer workers are used.
             """)
     else:
@@ -333,8 +666,96 @@ def big_o_analysis():
                  
                 The **Normal Sieve** runs sequentially and has a time complexity of O(n log log n). It is effective for smaller limits but can be slow for larger numbers.
                 The **Parallel Sieve** splits the task among multiple workers, improving execution time for larger values of `n`. However, the benefit of parallelization is more pronounced when dealing with larger datasets, and can be limited by the overhead of managing multiple processes.
+                **Prime Counting** with Lucy_Hedgehog's method only tracks the counts at the O(sqrt(n)) values n // k, so pi(10^12) takes seconds where a sieve would need terabytes. **Miller-Rabin** answers "is n prime?" with a dozen modular exponentiations, no matter how far n lies beyond any sieve.
             """)
 
+# ------------------------------- BACKGROUND JOBS -------------------------------
+
+# Algorithms that can run as background jobs:
+# name -> (function, arguments built from (n, workers), reports progress, uses workers)
+JOB_ALGORITHMS = {
+    "Recursive Fibonacci": (fibonacci_recursive, lambda n, workers: (n,), False, False),
+    "Dynamic Programming Fibonacci": (fibonacci_dynamic, lambda n, workers: (n,), False, False),
+    "Fast Doubling Fibonacci": (fibonacci_fast, lambda n, workers: (n,), False, False),
+    "Parallel Fibonacci": (parallel_fibonacci, lambda n, workers: (n, workers, "last"), True, True),
+    "Normal Sieve (python)": (sieve_of_eratosthenes, lambda n, workers: (n,), False, False),
+    "Segmented Sieve": (segmented_sieve, lambda n, workers: (n,), True, False),
+    # Adaptive tasks of about a tenth of a second each, so progress arrives steadily instead of once per worker
+    "Parallel Sieve": (partial(parallel_sieve, scheduler=ChunkScheduler("adaptive")), lambda n, workers: (n, workers),
+                       True, True),
+}
+
+# Seconds between progress bar refreshes while jobs are running
+JOB_REFRESH_INTERVAL = 0.2
+
+def show_job_progress(jobs):
+    """
+    Show a progress bar per running job and refresh them until every job has finished.
+
+    Jobs that report progress (per segment for the sieves, per chunk for Parallel Fibonacci)
+    show the share done; the others show how much of their timeout they have used.
+    """
+    bars = {job.id: st.progress(0.0) for job in jobs}
+    while jobs:
+        for job in jobs:
+            job.poll()
+            if job.fraction is not None:
+                value = job.fraction
+                text = f"Job {job.id} ({job.name}): {value:.0%} done after {job.elapsed:.1f} seconds"
+            else:
+                value = min(1.0, job.elapsed / job.timeout)
+                text = f"Job {job.id} ({job.name}): {job.elapsed:.1f} of {job.timeout:.0f} seconds before the timeout"
+            bars[job.id].progress(value, text=text)
+        jobs = [job for job in jobs if job.status == "running"]
+        time.sleep(JOB_REFRESH_INTERVAL)
+
+def background_jobs_page():
+    st.header("Background Jobs")
+    st.write("""
+        Each job runs in its own process, so the page stays responsive and shows its progress while it works.
+        A job can be cancelled at any time and is killed, together with any worker processes it started, once it exceeds its timeout.
+        Finished jobs stay in the history below for the rest of the session so their times can be compared.
+    """)
+    jobs = st.session_state.setdefault("jobs", [])
+
+    name = st.selectbox("Algorithm to run:", list(JOB_ALGORITHMS))
+    func, make_args, with_progress, uses_workers = JOB_ALGORITHMS[name]
+    n = st.number_input("Enter n (the limit for the sieves):", min_value=1, max_value=10**12, value=30)
+    workers = 1
+    if uses_workers:
+        workers = st.slider("Select the number of parallel workers:", 1, multiprocessing.cpu_count(), 2)
+    timeout = st.number_input("Hard timeout (seconds):", min_value=1.0, max_value=3600.0, value=60.0)
+
+    if st.button("Start Job"):
+        # One type per column, as Arrow requires: the worker count is shown as text next to "-"
+        params = {"n": n, "Workers": str(workers) if uses_workers else "-"}
+        jobs.append(Job(name, func, make_args(n, workers), params, timeout, with_progress))
+
+    # Cancel buttons come before the wait loop: a click reruns the script, which
+    # interrupts the loop of the previous run and cancels the job here
+    running = [job for job in jobs if job.poll()]
+    for job in running:
+        if st.button(f"Cancel job {job.id} ({job.name}, n={job.params['n']})", key=f"cancel-job-{job.id}"):
+            job.cancel()
+    show_job_progress([job for job in running if job.status == "running"])
+
+    finished = [job for job in jobs if job.status != "running"]
+    if finished:
+        st.subheader("Job History")
+        st.table([job.row() for job in finished])
+        completed = [job for job in finished if job.status == "done"]
+        if completed:
+            fig, ax = plt.subplots()
+            ax.bar([f"#{job.id} {job.name}" for job in completed], [job.seconds for job in completed], color='blue')
+            ax.set_xlabel('Job')
+            ax.set_ylabel('Execution Time (seconds)')
+            ax.set_title('Completed Jobs')
+            ax.tick_params(axis='x', labelrotation=45)
+            st.pyplot(fig)
+        if st.button("Clear history"):
+            jobs[:] = [job for job in jobs if job.status == "running"]
+            st.rerun()
+
 # ------------------------------- INTRODUCTION PAGE -------------------------------
 
 def introduction_page():
@@ -343,7 +764,7 @@ def introduction_page():
     **Welcome to the Algorithm Performance Evaluation App!**
 
     This app allows you to evaluate and compare the performance of different algorithms with a focus on two primary algorithms:
-    - **Fibonacci Sequence** (Recursive, Dynamic Programming, and Parallelized versions)
+    - **Fibonacci Sequence** (Recursive, Dynamic Programming, Fast Doubling and Parallelized versions)
     - **Sieve of Eratosthenes** (Normal and Parallelized versions)
 
     
@@ -354,6 +775,7 @@ def introduction_page():
     2. **Performance Comparison**: Compare the performance of the Fibonacci sequence and the Sieve of Eratosthenes algorithms in terms of execution time, with **cProfile** used for profiling.
     3. **Parallelization**: Explore how parallel execution affects performance for both algorithms and compare execution times with different numbers of workers with cProfile.
     4. **Big O Analysis**: A practical analysis of the time complexity of the Fibonacci and Sieve of Eratosthenes algorithms, both in their normal and parallelized forms.
+    5. **Background Jobs**: Run long computations in the background with a progress bar, cancel them or let a timeout stop them, and compare finished runs.
 
     Use the sidebar to navigate between the different sections of the app. Each section is designed to give you a deeper understanding of algorithmic performance, parallelization, and time complexity.
     """)
@@ -363,7 +785,7 @@ def introduction_page():
 # Sidebar with names and roll numbers alongside page navigation
 page = st.sidebar.radio(
     "Select a Page",
-    ["Introduction", "Performance Comparison", "Parallelization", "Big O Analysis"],
+    ["Introduction", "Performance Comparison", "Parallelization", "Big O Analysis", "Background Jobs"],
 )
 
 # Add a bold and larger font display of names and roll numbers on the sidebar
@@ -383,3 +805,5 @@ elif page == "Parallelization":
     parallelization_section()
 elif page == "Big O Analysis":
     big_o_analysis()
+elif page == "Background Jobs":
+    background_jobs_page()
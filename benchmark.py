@@ -0,0 +1,127 @@
+import gc
+import math
+import time
+import statistics
+
+# ------------------------------- BENCHMARK RUNNER -------------------------------
+
+# z-score for the 95% confidence interval of the median
+Z_95 = 1.96
+
+class BenchmarkResult:
+    """
+    Timings of one benchmarked configuration.
+
+    `samples` holds one wall-clock duration per timed repeat, in nanoseconds
+    from time.perf_counter_ns. Warm-up runs are not included. For parallel
+    runs `bytes_moved` can record how much data one run pickled between
+    processes.
+    """
+
+    def __init__(self, algorithm, samples, backend=None, n=None, workers=None, bytes_moved=None):
+        self.algorithm = algorithm
+        self.backend = backend
+        self.n = n
+        self.workers = workers
+        self.bytes_moved = bytes_moved
+        self.samples = list(samples)
+
+    @property
+    def seconds(self):
+        return [sample / 1e9 for sample in self.samples]
+
+    @property
+    def median(self):
+        return statistics.median(self.seconds)
+
+    @property
+    def iqr(self):
+        """Return the (first quartile, third quartile) of the samples, in seconds."""
+        if len(self.samples) < 2:
+            return self.median, self.median
+        q1, _, q3 = statistics.quantiles(self.seconds, n=4, method="inclusive")
+        return q1, q3
+
+    @property
+    def confidence_interval(self):
+        """
+        Return a distribution-free 95% confidence interval for the median, in seconds.
+
+        The bounds are the order statistics whose ranks sit Z_95 standard
+        deviations of the binomial(n, 1/2) distribution away from n / 2.
+        """
+        ordered = sorted(self.seconds)
+        count = len(ordered)
+        half_width = Z_95 * math.sqrt(count) / 2
+        low = max(0, math.floor(count / 2 - half_width))
+        high = min(count - 1, math.ceil(count / 2 + half_width) - 1)
+        return ordered[low], ordered[high]
+
+    def to_dict(self):
+        return {
+            "algorithm": self.algorithm,
+            "backend": self.backend,
+            "n": self.n,
+            "workers": self.workers,
+            "bytes_moved": self.bytes_moved,
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["algorithm"], data["samples"], data.get("backend"), data.get("n"), data.get("workers"),
+                   data.get("bytes_moved"))
+
+    def summary(self):
+        """Return one display row with the statistics of this result."""
+        q1, q3 = self.iqr
+        low, high = self.confidence_interval
+        row = {
+            "Algorithm": self.algorithm,
+            "Backend": self.backend or "-",
+            "n": self.n,
+            "Workers": self.workers or "-",
+            "Runs": len(self.samples),
+            "Median (s)": f"{self.median:.6f}",
+            "IQR (s)": f"{q1:.6f} - {q3:.6f}",
+            "95% CI of Median (s)": f"{low:.6f} - {high:.6f}",
+        }
+        if self.bytes_moved is not None:
+            row["Bytes Moved Between Processes"] = self.bytes_moved
+        return row
+
+def benchmark(func, *args, algorithm=None, backend=None, n=None, workers=None,
+              warmup=1, repeat=5, disable_gc=True, bytes_moved=None):
+    """
+    Time func(*args) and return a BenchmarkResult.
+
+    The function runs `warmup` times untimed, then `repeat` times with each
+    run timed on its own with perf_counter_ns. With disable_gc the cyclic
+    garbage collector is switched off during the timed runs so a collection
+    triggered by an earlier allocation cannot land inside a sample. Nothing
+    is profiled or rendered here; do that in a separate, untimed run, and
+    pass what it measured as `bytes_moved` to keep it with the timings.
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    for _ in range(warmup):
+        func(*args)
+
+    gc_was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.collect()
+        gc.disable()
+    samples = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            func(*args)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        if disable_gc and gc_was_enabled:
+            gc.enable()
+    return BenchmarkResult(algorithm or func.__name__, samples, backend, n, workers, bytes_moved)
+
+def significantly_faster(result, baseline):
+    """Return True if result's median CI lies entirely below baseline's."""
+    return result.confidence_interval[1] < baseline.confidence_interval[0]
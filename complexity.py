@@ -0,0 +1,91 @@
+import math
+import time
+import multiprocessing
+
+from benchmark import benchmark
+
+# ------------------------------- EMPIRICAL COMPLEXITY -------------------------------
+
+# Candidate growth functions f(n); a fit models the running time as c * f(n)
+COMPLEXITY_CLASSES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    "O(log^3 n)": lambda n: math.log(n) ** 3,
+    "O(n^(2/3))": lambda n: float(n) ** (2 / 3),
+    "O(n^(3/4))": lambda n: float(n) ** 0.75,
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n log log n)": lambda n: n * math.log(math.log(n)),
+    "O(n^2)": lambda n: float(n) ** 2,
+    "O(2^n)": lambda n: 2.0 ** n,
+}
+
+# Runs in the sweep's child process so a point that blows its budget can be killed
+def _time_point(job):
+    func, n, extra_args, repeat = job
+    return benchmark(func, n, *extra_args, warmup=0, repeat=repeat).median
+
+def scaling_sweep(func, start, stop=None, factor=2.0, point_budget=2.0, total_budget=30.0, repeat=3, extra_args=()):
+    """
+    Time func(n, *extra_args) over the geometric series start, start*factor, ...
+
+    Every point runs in a separate worker process and is abandoned, with the
+    process killed, once it takes longer than point_budget seconds; larger n
+    would only be slower, so the sweep ends there. It also ends after stop or
+    once total_budget seconds have been spent. Returns (ns, median seconds,
+    the n that timed out or None).
+    """
+    ns, times = [], []
+    aborted_at = None
+    spent = 0.0
+    pool = multiprocessing.Pool(1)
+    try:
+        n = start
+        while stop is None or n <= stop:
+            started = time.perf_counter()
+            try:
+                median = pool.apply_async(_time_point, ((func, n, extra_args, repeat),)).get(timeout=point_budget)
+            except multiprocessing.TimeoutError:
+                aborted_at = n
+                break
+            spent += time.perf_counter() - started
+            ns.append(n)
+            times.append(median)
+            if spent > total_budget:
+                break
+            # Round to whole n, and always move forward for small n with a small factor
+            n = max(n + 1, round(n * factor))
+    finally:
+        pool.terminate()
+        pool.join()
+    return ns, times, aborted_at
+
+def fit_complexity(ns, times):
+    """
+    Fit times against every complexity class by least squares on log(time).
+
+    For t = c * f(n) the best c is the geometric mean of t / f(n), and the
+    residual is the mean squared error of log(t) - log(c * f(n)); fitting in
+    log space keeps the many fast small-n points from being swamped by the
+    slowest one. Classes that cannot be evaluated on the measured n (2^n
+    overflowing, log log n not positive) are skipped. Returns (name, c,
+    residual) tuples, best fit first.
+    """
+    fits = []
+    for name, f in COMPLEXITY_CLASSES.items():
+        try:
+            values = [f(n) for n in ns]
+        except (OverflowError, ValueError):
+            continue
+        if any(not math.isfinite(v) or v <= 0 for v in values):
+            continue
+        log_ratios = [math.log(max(t, 1e-9)) - math.log(v) for t, v in zip(times, values)]
+        log_c = sum(log_ratios) / len(log_ratios)
+        residual = sum((r - log_c) ** 2 for r in log_ratios) / len(log_ratios)
+        fits.append((name, math.exp(log_c), residual))
+    return sorted(fits, key=lambda fit: fit[2])
+
+def fitted_times(name, coefficient, ns):
+    """Evaluate a fitted class c * f(n) at every n."""
+    f = COMPLEXITY_CLASSES[name]
+    return [coefficient * f(n) for n in ns]
@@ -0,0 +1,187 @@
+import math
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    # Only the "shared_memory" transport needs NumPy
+    np = None
+
+from shared_arrays import SharedArray, attach_shared, check_transport
+from scheduler import dispatch_range
+
+# ------------------------------- FIBONACCI FUNCTIONS -------------------------------
+
+# Naive Fibonacci (Recursive)
+def fibonacci_recursive(n):
+    if n <= 1:
+        return n
+    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
+
+# Optimized Fibonacci using dynamic programming
+def fibonacci_dynamic(n):
+    fib = [0, 1]
+    for i in range(2, n+1):
+        fib.append(fib[i-1] + fib[i-2])
+    return fib[n]
+
+# The whole sequence F(0) .. F(n) in one O(n) pass
+def fibonacci_sequence(n):
+    sequence = [0, 1][:n + 1]
+    for i in range(2, n + 1):
+        sequence.append(sequence[i - 1] + sequence[i - 2])
+    return sequence
+
+# Fast doubling Fibonacci: O(log n) multiplications, constant number of live integers
+def fibonacci_fast(n, mod=None):
+    """
+    Return F(n), or F(n) % mod when a modulus is given.
+
+    Uses the fast doubling identities
+        F(2k)   = F(k) * (2 * F(k + 1) - F(k))
+        F(2k+1) = F(k)^2 + F(k + 1)^2
+    walking the bits of n from the most significant one. With a modulus every
+    intermediate value stays below mod, so huge n remain cheap.
+    """
+    return fibonacci_pair(n, mod)[0]
+
+def fibonacci_pair(n, mod=None):
+    """Return (F(n), F(n + 1)), optionally reduced modulo mod."""
+    if n < 0:
+        raise ValueError(f"Fibonacci index must be non-negative, got {n}")
+    if mod is not None and mod < 1:
+        raise ValueError(f"Modulus must be a positive integer, got {mod}")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if mod is not None:
+            a, b = a % mod, b % mod
+    return a, b
+
+# Result modes for parallel_fibonacci. "values" returns the whole sequence,
+# the other modes keep what crosses the process boundary small.
+FIB_RESULT_MODES = ("values", "last", "checksum", "mod")
+
+# Checksums are sums of Fibonacci numbers modulo 2**64
+CHECKSUM_MOD = 1 << 64
+
+# Worker function for parallel Fibonacci: jumps straight to F(start) with fast
+# doubling and only produces its own [start, end) slice of F(0) .. F(n - 1)
+def fib_worker_task(task):
+    start, end, mode, mod, n = task
+    if start >= end:
+        return [] if mode in ("values", "mod") else None
+    if mode == "last":
+        # Only the chunk that ends the sequence has F(n - 1) to compute
+        return fibonacci_fast(end - 1) if end == n else None
+    if mode == "checksum":
+        mod = CHECKSUM_MOD
+    elif mode == "values":
+        mod = None
+    a, b = fibonacci_pair(start, mod)
+    if mode == "checksum":
+        total = 0
+        for _ in range(start, end):
+            total += a
+            a, b = b, (a + b) % mod
+        return total % mod
+    result = []
+    for _ in range(start, end):
+        result.append(a)
+        a, b = b, a + b
+        if mod is not None:
+            b %= mod
+    return result
+
+# F(i) < phi^i, so it never needs more than i * log2(phi) + 1 bits
+LOG2_PHI = math.log2((1 + math.sqrt(5)) / 2)
+
+def fib_slot_widths(start, end):
+    """Bytes reserved for each of F(start) .. F(end - 1) in a shared limb buffer, with one spare byte."""
+    return [int(i * LOG2_PHI) // 8 + 2 for i in range(start, end)]
+
+# Worker function for the shared-memory transport: writes residues, or the
+# little-endian bytes of every number into its fixed-width slot, in place
+def fib_shared_worker_task(task):
+    start, end, mode, mod, spec, offset = task
+    block, out = attach_shared(spec)
+    try:
+        if mode == "mod":
+            out[start:end] = fib_worker_task((start, end, mode, mod, end))
+        else:
+            a, b = fibonacci_pair(start)
+            for width in fib_slot_widths(start, end):
+                out[offset:offset + width] = np.frombuffer(a.to_bytes(width, "little"), dtype=np.uint8)
+                offset += width
+                a, b = b, a + b
+    finally:
+        del out
+        block.close()
+    return end - start
+
+def _decode_limbs(limbs, offsets):
+    return [int.from_bytes(limbs[offsets[i]:offsets[i + 1]], "little") for i in range(len(offsets) - 1)]
+
+# Parallelized Fibonacci Sequence
+def parallel_fibonacci(n, workers=2, mode="values", mod=None, executor=None, profile=None, transport="pickle",
+                       progress=None, scheduler=None):
+    """
+    Compute F(0) .. F(n - 1) split across workers.
+
+    mode selects what comes back: "values" is the list of numbers, "mod" the
+    list of residues modulo mod, "last" just F(n - 1), which only the chunk
+    ending the sequence computes, and "checksum" the sum of the sequence
+    modulo 2**64. Pass a long-lived executor to skip
+    starting a new process pool for the call, and a ParallelProfile to
+    profile the chunks inside the workers.
+
+    With the "shared_memory" transport, "values" and "mod" results are
+    written by the workers into shared memory instead of being pickled:
+    every F(i) gets a slot of fib_slot_widths bytes, and residues (mod at
+    most 2**64) become a uint64 NumPy array. "last" and "checksum" already
+    return a single number and ignore the transport. `progress(done, total)`
+    is called as each chunk comes back. By default there is one chunk per
+    worker; later chunks hold far larger numbers, so a ChunkScheduler passed
+    as `scheduler` can size and feed smaller chunks instead.
+    """
+    if mode not in FIB_RESULT_MODES:
+        raise ValueError(f"Unknown result mode: {mode!r}, expected one of {FIB_RESULT_MODES}")
+    if mode == "mod" and (mod is None or mod < 1):
+        raise ValueError(f"The \"mod\" result mode needs a positive modulus, got {mod}")
+    check_transport(transport)
+
+    if transport == "shared_memory" and mode == "mod":
+        if mod > 2**64:
+            raise ValueError(f"Shared-memory residues are uint64, so the modulus must be at most 2**64, got {mod}")
+        with SharedArray(n, np.uint64) as residues:
+            dispatch_range(fib_shared_worker_task, lambda start, end: (start, end, mode, mod, residues.spec, 0),
+                           0, n, workers, executor, profile, progress, scheduler)
+            # The block is unlinked on return, so the residues are copied out once
+            return residues.array.copy()
+    if transport == "shared_memory" and mode == "values":
+        offsets = [0, *accumulate(fib_slot_widths(0, n))]
+        with SharedArray(offsets[-1], np.uint8) as limbs:
+            dispatch_range(fib_shared_worker_task, lambda start, end: (start, end, mode, mod, limbs.spec, offsets[start]),
+                           0, n, workers, executor, profile, progress, scheduler)
+            return _decode_limbs(limbs.array, offsets)
+
+    results = dispatch_range(fib_worker_task, lambda start, end: (start, end, mode, mod, n),
+                             0, n, workers, executor, profile, progress, scheduler)
+    if mode == "last":
+        # A scheduler makes no tasks at all for n == 0, where the static split makes empty ones
+        return results[-1] if results else None
+    if mode == "checksum":
+        return sum(r for r in results if r is not None) % CHECKSUM_MOD
+    return [item for sublist in results for item in sublist]
+
+# Single-number Fibonacci implementations, by the name shown in the UI
+FIBONACCI_ALGORITHMS = {
+    "Recursive": fibonacci_recursive,
+    "Dynamic Programming": fibonacci_dynamic,
+    "Fast Doubling": fibonacci_fast,
+}
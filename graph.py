@@ -1,52 +1,76 @@
-import matplotlib.pyplot as plt
-
-# Updated data for Fibonacci execution times (n=35)
-fibo_environments = ['PyPy', 'CPython', 'Nuitka', 'Anaconda']
-fibo_times = [1.1444091796875e-05, 2.1457672119140625e-06, 4.0531158447265625e-06, 2.1457672119140625e-06]
-
-# Data for Sieve execution times (n=100000)
-sieve_environments = ['PyPy', 'CPython', 'Anaconda', 'Nuitka']
-sieve_times = [0.0029091835021972656, 0.006265163421630859, 0.0051004886627197266, 0.00568389892578125]
-
-def create_fibo_graph():
-    """Creates and saves the Fibonacci execution time graph with appropriate y-axis range."""
-    plt.figure(figsize=(8, 6))
-    bars = plt.bar(fibo_environments, fibo_times, color=['red', 'green', 'blue', 'orange'])
-    plt.ylim(0, 1.5e-05)  # Set y-axis range for better visualization
-    plt.title('Fibonacci Execution Time Comparison (n=35)', fontsize=14)
-    plt.xlabel('Environment', fontsize=12)
-    plt.ylabel('Time (seconds)', fontsize=12)
-
-    # Annotate the bars with the exact values
-    for bar, time in zip(bars, fibo_times):
-        plt.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), 
-                 f'{time:.2e}', ha='center', va='bottom', fontsize=10)
-
-    plt.tight_layout()
-    plt.savefig("fibo_graph.png")  # Save as an image file
-    plt.close()  # Close the plot to avoid overlap with other graphs
-
-
-def create_sieve_graph():
-    """Creates and saves the Sieve of Eratosthenes execution time graph with appropriate y-axis range."""
-    plt.figure(figsize=(8, 6))
-    bars = plt.bar(sieve_environments, sieve_times, color=['red', 'green', 'orange', 'blue'])
-    plt.ylim(0, 0.007)  # Set y-axis range for better visualization
-    plt.title('Sieve of Eratosthenes Execution Time Comparison (n=100000)', fontsize=14)
-    plt.xlabel('Environment', fontsize=12)
-    plt.ylabel('Time (seconds)', fontsize=12)
-
-    # Annotate the bars with the exact values
-    for bar, time in zip(bars, sieve_times):
-        plt.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), 
-                 f'{time:.4f}', ha='center', va='bottom', fontsize=10)
-
-    plt.tight_layout()
-    plt.savefig("sieve_graph.png")  # Save as an image file
-    plt.close()  # Close the plot to avoid overlap with other graphs
-
-
-if __name__ == "__main__":
-    create_fibo_graph()  # Create Fibonacci graph
-    create_sieve_graph()  # Create Sieve graph
-    print("Graphs have been saved as 'fibo_graph.png' and 'sieve_graph.png'.")
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+
+from benchmark import significantly_faster
+from interpreter_bench import RESULTS_FILE, TASKS, load_records
+
+# The charts are plotted from the measurements saved by interpreter_bench.py;
+# re-run it on your own hardware to regenerate them.
+FIBO_ALGORITHM = TASKS["fibonacci"][0]
+SIEVE_ALGORITHM = TASKS["sieve"][0]
+COLORS = ['red', 'green', 'blue', 'orange', 'purple', 'brown']
+
+def plot_interpreter_times(records, title):
+    """Plots the median time per interpreter with IQR error bars and returns the figure."""
+    labels = [label for label, _ in records]
+    medians = [result.median for _, result in records]
+    lower = [result.median - result.iqr[0] for _, result in records]
+    upper = [result.iqr[1] - result.median for _, result in records]
+
+    fig = plt.figure(figsize=(8, 6))
+    bars = plt.bar(labels, medians, yerr=[lower, upper], capsize=6, color=COLORS[:len(records)])
+    plt.title(f'{title} (n={records[0][1].n})', fontsize=14)
+    plt.xlabel('Environment', fontsize=12)
+    plt.ylabel('Median Time (seconds)', fontsize=12)
+
+    # Annotate the bars with the median values, above the error bars
+    for bar, time, (_, result) in zip(bars, medians, records):
+        plt.text(bar.get_x() + bar.get_width() / 2, result.iqr[1],
+                 f'{time:.2e}', ha='center', va='bottom', fontsize=10)
+
+    plt.tight_layout()
+    return fig
+
+def _create_graph(algorithm, title, output, results_path):
+    """Plots the measured times of one algorithm and saves the chart to output."""
+    records = load_records(results_path, algorithm)
+    if not records:
+        raise ValueError(f"No {algorithm} results in {results_path}, run interpreter_bench.py first")
+    fig = plot_interpreter_times(records, title)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(output)  # Save as an image file
+    plt.close(fig)  # Close the plot to avoid overlap with other graphs
+
+
+def create_fibo_graph(results_path=RESULTS_FILE, output="images/fibonacci/fibo_graph.png"):
+    """Creates and saves the Fibonacci execution time graph from the measured results."""
+    _create_graph(FIBO_ALGORITHM, 'Fibonacci Execution Time Comparison', output, results_path)
+
+
+def create_sieve_graph(results_path=RESULTS_FILE, output="images/sieve/sieve_graph.png"):
+    """Creates and saves the Sieve of Eratosthenes execution time graph from the measured results."""
+    _create_graph(SIEVE_ALGORITHM, 'Sieve of Eratosthenes Execution Time Comparison', output, results_path)
+
+
+def describe_findings(records):
+    """Returns markdown findings for (interpreter, BenchmarkResult) pairs, fastest first."""
+    ranked = sorted(records, key=lambda record: record[1].median)
+    fastest_label, fastest = ranked[0]
+    low, high = fastest.confidence_interval
+    lines = [f"From the graph (n={fastest.n}, {len(fastest.samples)} timed runs each), we observe the following:",
+             f"- **{fastest_label}** is the fastest with a median of {fastest.median:.2e} seconds "
+             f"(95% CI {low:.2e} - {high:.2e})."]
+    for label, result in ranked[1:]:
+        ratio = result.median / fastest.median
+        line = f"- **{label}** takes {result.median:.2e} seconds, {ratio:.2f}x the time of {fastest_label}"
+        if not significantly_faster(fastest, result):
+            line += ", but their confidence intervals overlap so the gap is within measurement noise"
+        lines.append(line + ".")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    create_fibo_graph()  # Create Fibonacci graph
+    create_sieve_graph()  # Create Sieve graph
+    print("Graphs have been saved as 'images/fibonacci/fibo_graph.png' and 'images/sieve/sieve_graph.png'.")
@@ -0,0 +1,128 @@
+"""
+Run the app's algorithms under several Python interpreters and save the timings.
+
+Each interpreter is given as LABEL=COMMAND, where COMMAND is anything that runs
+a Python script (it is split like a shell command line), for example:
+
+    python interpreter_bench.py \
+        --interpreter CPython=python3 \
+        --interpreter PyPy=pypy3 \
+        --interpreter Anaconda=/opt/conda/bin/python \
+        --interpreter "Nuitka=python3 -m nuitka --run --remove-output"
+
+For every interpreter this script re-runs itself in child mode under that
+command, times each task there with benchmark.benchmark() and collects the
+samples into a JSON results file (and optionally a CSV with one row per
+sample). graph.py plots its charts from that file.
+"""
+import sys
+import csv
+import json
+import shlex
+import argparse
+import platform
+import subprocess
+from pathlib import Path
+
+from benchmark import BenchmarkResult, benchmark
+
+SCRIPT = Path(__file__).resolve()
+RESULTS_FILE = SCRIPT.parent / "results" / "interpreter_benchmarks.json"
+
+# Task name on the command line -> (algorithm label, default n)
+TASKS = {
+    "fibonacci": ("Recursive Fibonacci", 30),
+    "sieve": ("Sieve of Eratosthenes", 100000),
+}
+
+def _task_function(task):
+    # Imported here so the parent process never needs the algorithm modules
+    if task == "fibonacci":
+        from fibonacci import fibonacci_recursive
+        return fibonacci_recursive
+    from sieve import sieve_of_eratosthenes
+    return sieve_of_eratosthenes
+
+def run_child(task, n, warmup, repeat):
+    """Benchmark one task in this interpreter and print the record as JSON."""
+    result = benchmark(_task_function(task), n, algorithm=TASKS[task][0], backend="python", n=n,
+                       warmup=warmup, repeat=repeat)
+    record = result.to_dict()
+    record["implementation"] = platform.python_implementation()
+    record["version"] = platform.python_version()
+    print(json.dumps(record))
+
+def run_interpreter(label, command, task, n, warmup, repeat, timeout=None):
+    """Run one task under the interpreter command and return its result record."""
+    args = shlex.split(command) + [str(SCRIPT), "--child", task, "--n", str(n),
+                                   "--warmup", str(warmup), "--repeat", str(repeat)]
+    completed = subprocess.run(args, cwd=SCRIPT.parent, capture_output=True, text=True, timeout=timeout)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{label} failed on {task}:\n{completed.stderr}")
+    # Compilers such as Nuitka print progress first; the record is the last line
+    record = json.loads(completed.stdout.strip().splitlines()[-1])
+    record["interpreter"] = label
+    return record
+
+def write_csv(records, path):
+    """Write one row per timing sample."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["interpreter", "implementation", "version", "algorithm", "n", "sample", "seconds"])
+        for record in records:
+            for i, sample in enumerate(record["samples"]):
+                writer.writerow([record["interpreter"], record["implementation"], record["version"],
+                                 record["algorithm"], record["n"], i, sample / 1e9])
+
+def load_records(path=RESULTS_FILE, algorithm=None):
+    """
+    Return (interpreter label, BenchmarkResult) pairs from a results file,
+    optionally only those of one algorithm.
+    """
+    with open(path) as f:
+        records = json.load(f)
+    return [(record["interpreter"], BenchmarkResult.from_dict(record)) for record in records
+            if algorithm is None or record["algorithm"] == algorithm]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interpreter", action="append", metavar="LABEL=COMMAND",
+                        help="interpreter to benchmark, may be repeated (default: the current one)")
+    parser.add_argument("--task", action="append", choices=list(TASKS), help="task to run (default: all)")
+    parser.add_argument("--fib-n", type=int, default=TASKS["fibonacci"][1], help="n for the recursive Fibonacci")
+    parser.add_argument("--sieve-n", type=int, default=TASKS["sieve"][1], help="limit for the sieve")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per interpreter and task")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds allowed per interpreter and task")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE, help="JSON results file")
+    parser.add_argument("--csv", type=Path, default=None, help="also write the raw samples to this CSV file")
+    parser.add_argument("--child", choices=list(TASKS), help=argparse.SUPPRESS)
+    parser.add_argument("--n", type=int, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.child:
+        run_child(args.child, args.n, args.warmup, args.repeat)
+        return
+
+    interpreters = args.interpreter or [f"{platform.python_implementation()}={shlex.quote(sys.executable)}"]
+    sizes = {"fibonacci": args.fib_n, "sieve": args.sieve_n}
+    records = []
+    for spec in interpreters:
+        label, sep, command = spec.partition("=")
+        if not sep:
+            label, command = spec, spec
+        for task in args.task or list(TASKS):
+            print(f"Running {task} (n={sizes[task]}) under {label}...", file=sys.stderr)
+            records.append(run_interpreter(label, command, task, sizes[task], args.warmup, args.repeat, args.timeout))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(records, f, indent=2)
+    if args.csv:
+        write_csv(records, args.csv)
+    print(f"Saved {len(records)} results to {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+import os
+import time
+import queue
+import atexit
+import signal
+import itertools
+import traceback
+import multiprocessing
+
+# ------------------------------- BACKGROUND JOBS -------------------------------
+
+# Seconds between progress messages from a job, so a tight loop cannot flood the queue
+PROGRESS_INTERVAL = 0.1
+
+# Jobs that may still have a process running, killed when the interpreter exits
+_live_jobs = set()
+
+_job_ids = itertools.count(1)
+
+def describe_result(result):
+    """Return a short description of an algorithm's result, cheap to send back from the job process."""
+    if isinstance(result, bool):
+        return str(result)
+    if hasattr(result, "__len__"):
+        return f"{len(result)} values"
+    if isinstance(result, int) and result.bit_length() > 64:
+        return f"{result.bit_length()}-bit integer"
+    return str(result)
+
+# Entry point of the job process. It leads its own process group so that
+# killing the group also takes down any worker pool the algorithm started.
+def _job_main(func, args, with_progress, messages):
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    last_report = 0.0
+
+    def report(done, total):
+        nonlocal last_report
+        now = time.perf_counter()
+        if done >= total or now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            messages.put(("progress", done, total))
+
+    try:
+        start = time.perf_counter()
+        result = func(*args, progress=report) if with_progress else func(*args)
+        seconds = time.perf_counter() - start
+        messages.put(("done", describe_result(result), seconds))
+    except Exception:
+        messages.put(("failed", traceback.format_exc()))
+
+class Job:
+    """
+    One algorithm run in its own process, so it can be cancelled or timed out by killing it.
+
+    Call poll() regularly: it applies the progress and result messages the
+    job sent and enforces the timeout. `status` is "running", "done",
+    "failed", "cancelled" or "timed out"; `seconds` is the run time measured
+    inside the job, `result` a short description of what it returned.
+    """
+
+    def __init__(self, name, func, args=(), params=None, timeout=None, with_progress=False):
+        self.id = next(_job_ids)
+        self.name = name
+        self.params = dict(params or {})
+        self.timeout = timeout
+        self.status = "running"
+        self.done = 0
+        self.total = None
+        self.result = None
+        self.seconds = None
+        self.error = None
+        self._messages = multiprocessing.Queue()
+        # Not a daemon: parallel algorithms start their own worker processes
+        self._process = multiprocessing.Process(target=_job_main, args=(func, args, with_progress, self._messages))
+        self.started = time.perf_counter()
+        self.finished = None
+        self._process.start()
+        _live_jobs.add(self)
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def fraction(self):
+        """Share of the work done, or None while the job has not reported any progress."""
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+    def _apply(self, message):
+        kind, *payload = message
+        if kind == "progress":
+            self.done, self.total = payload
+        elif kind == "done":
+            self.result, self.seconds = payload
+            self._finish("done")
+        elif kind == "failed":
+            self.error = payload[0]
+            self._finish("failed")
+
+    def _finish(self, status):
+        self.status = status
+        self.finished = time.perf_counter()
+        self._process.join(timeout=1)
+        _live_jobs.discard(self)
+
+    def poll(self):
+        """Apply pending messages and enforce the timeout; return True while the job is running."""
+        while self.status == "running":
+            try:
+                self._apply(self._messages.get_nowait())
+            except queue.Empty:
+                break
+        if self.status != "running":
+            return False
+        if self.timeout is not None and self.elapsed > self.timeout:
+            self.kill("timed out")
+        elif not self._process.is_alive():
+            # The process may exit just before its last message can be read
+            try:
+                self._apply(self._messages.get(timeout=0.5))
+            except queue.Empty:
+                self.error = f"Job process exited with code {self._process.exitcode}"
+                self._finish("failed")
+        return self.status == "running"
+
+    def kill(self, status="cancelled"):
+        """Stop the job by killing its process group, or just its process where groups are not available."""
+        if self.status != "running":
+            return
+        try:
+            os.killpg(self._process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            self._process.kill()
+        self._finish(status)
+
+    def cancel(self):
+        self.kill("cancelled")
+
+    def row(self):
+        """Return one display row describing this job."""
+        return {
+            "Job": self.id,
+            "Algorithm": self.name,
+            **self.params,
+            "Status": self.status,
+            "Time (s)": f"{self.seconds:.6f}" if self.seconds is not None else f"{self.elapsed:.2f} (wall)",
+            "Result": self.error.strip().splitlines()[-1] if self.error else self.result or "-",
+        }
+
+@atexit.register
+def _kill_live_jobs():
+    for job in list(_live_jobs):
+        job.kill()
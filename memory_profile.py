@@ -0,0 +1,198 @@
+import os
+import sys
+import threading
+import tracemalloc
+import concurrent.futures
+
+try:
+    import resource
+except ImportError:
+    # Windows has no resource module; peak RSS is then only read from /proc or left out
+    resource = None
+
+# ------------------------------- MEMORY PROFILING -------------------------------
+
+# Frames kept per traced allocation; one is enough to group by allocation site
+TRACEBACK_LIMIT = 1
+
+# Seconds between samples of the traced memory while the run looks for its peak
+PEAK_SAMPLE_INTERVAL = 0.01
+
+def reset_peak_rss():
+    """
+    Reset the peak RSS of this process to its current RSS, so it covers only what runs next.
+
+    Works on Linux, through /proc/self/clear_refs; returns False where that is not possible.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def peak_rss():
+    """Return the peak resident set size of this process in bytes, or None if it cannot be read."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+def top_allocations(snapshot, limit=10):
+    """Return the allocation sites holding the most memory in a tracemalloc snapshot, as table columns."""
+    # Leave out what the profiler itself allocated, including its sampling thread
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, path)
+                                       for path in (__file__, tracemalloc.__file__, threading.__file__)])
+    stats = snapshot.statistics("lineno")[:limit]
+    return {
+        "Allocation Site": [f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}" for stat in stats],
+        "Size (bytes)": [stat.size for stat in stats],
+        "Blocks": [stat.count for stat in stats],
+    }
+
+class PeakSampler(threading.Thread):
+    """
+    Samples the traced memory in the background and keeps the top allocation sites at its highest point.
+
+    Every `interval` seconds it reads the current traced size; each time that
+    is a new maximum it takes a snapshot and keeps only its `limit` largest
+    sites, so the snapshot is freed before the next sample. Snapshots are
+    traced too, so the tracemalloc peak is reset after each one; the run keeps
+    going meanwhile, so the peak is read into `traced_peak` right before every
+    reset, which over-counts it by at most the size of one snapshot.
+    """
+
+    def __init__(self, limit=10, interval=PEAK_SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.limit = limit
+        self.interval = interval
+        self.highest = -1
+        self.traced_peak = 0
+        self.sites = {}
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self.traced_peak = max(self.traced_peak, peak)
+        if current > self.highest:
+            self.highest = current
+            self.sites = top_allocations(tracemalloc.take_snapshot(), self.limit)
+            # The run may have peaked and freed its memory while the snapshot was taken
+            self.traced_peak = max(self.traced_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        """Stop sampling and take a last sample, so a run shorter than one interval still gets its sites."""
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+# Worker wrapper: runs one task under tracemalloc with a fresh peak RSS and
+# sends both peaks back with the result
+def memory_profiled_task(job):
+    func, task = job
+    rss_reset = reset_peak_rss()
+    tracemalloc.start(TRACEBACK_LIMIT)
+    try:
+        result = func(task)
+        _, traced_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    record = {
+        "pid": os.getpid(),
+        # Without a reset the peak RSS of a warm worker covers every task it ever ran
+        "peak_rss": peak_rss(),
+        "rss_reset": rss_reset,
+        "traced_peak": traced_peak,
+    }
+    return result, record
+
+class MemoryProfile:
+    """
+    Memory use of one run.
+
+    `traced_peak` is the tracemalloc peak in the calling process and `sites`
+    its top allocation sites at the highest sampled point of the run. Passed as `profile` to
+    parallel_sieve or parallel_fibonacci it also runs every task under
+    memory_profiled_task, and `tasks` holds one row per task with the
+    worker's peak RSS and tracemalloc peak.
+    """
+
+    def __init__(self):
+        self.traced_peak = None
+        self.sites = {}
+        self.tasks = []
+
+    def run(self, func, tasks, workers, executor=None):
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                return self.run(func, tasks, workers, executor)
+        results = []
+        for i, (result, record) in enumerate(executor.map(memory_profiled_task, [(func, task) for task in tasks])):
+            results.append(result)
+            self.tasks.append({
+                "Task": i,
+                "Worker PID": record["pid"],
+                "Peak RSS (bytes)": record["peak_rss"],
+                "Peak RSS Reset": record["rss_reset"],
+                "Traced Peak (bytes)": record["traced_peak"],
+            })
+        return results
+
+    @property
+    def worker_peak_rss(self):
+        """Largest peak RSS of any worker task, or None for a run without workers."""
+        peaks = [task["Peak RSS (bytes)"] for task in self.tasks if task["Peak RSS (bytes)"] is not None]
+        return max(peaks) if peaks else None
+
+    @property
+    def worker_traced_peak(self):
+        """Sum of the tracemalloc peaks of every worker task, or None for a run without workers."""
+        return sum(task["Traced Peak (bytes)"] for task in self.tasks) if self.tasks else None
+
+    def summary(self):
+        """Return one display row with the peaks of this run."""
+        return {
+            "Traced Peak (bytes)": self.traced_peak,
+            "Worker Peak RSS (bytes)": self.worker_peak_rss if self.tasks else "-",
+            "Worker Traced Peak, Summed (bytes)": self.worker_traced_peak if self.tasks else "-",
+        }
+
+def profile_memory(func, *args, parallel=False, limit=10):
+    """
+    Run func(*args) under tracemalloc and return (result, MemoryProfile).
+
+    With parallel=True func must take a `profile` keyword, as the parallel
+    algorithms do, and the workers are measured too. The allocation sites are
+    those of the highest point a PeakSampler caught while func ran, which may
+    miss a peak shorter than PEAK_SAMPLE_INTERVAL. Run this separately from
+    timed runs: tracing every allocation slows the code down considerably.
+    """
+    profile = MemoryProfile()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEBACK_LIMIT)
+    tracemalloc.reset_peak()
+    sampler = PeakSampler(limit)
+    sampler.start()
+    try:
+        result = func(*args, profile=profile) if parallel else func(*args)
+    finally:
+        sampler.stop()
+        if not was_tracing:
+            tracemalloc.stop()
+    profile.traced_peak = sampler.traced_peak
+    profile.sites = sampler.sites
+    return result, profile
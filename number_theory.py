@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+
+from sieve import base_primes, sieve_of_eratosthenes
+
+# ------------------------------- PRIME COUNTING -------------------------------
+
+def prime_pi(x):
+    """
+    Return pi(x), the number of primes <= x, without sieving up to x.
+
+    Lucy_Hedgehog's method: S(v) starts as the count of 2..v and, for every
+    prime p <= sqrt(x), loses the numbers whose smallest prime factor is p,
+        S(v) -= S(v // p) - S(p - 1)    for every v >= p^2.
+    Only the O(sqrt(x)) values v = x // k are ever needed, kept in two NumPy
+    arrays so each prime is one vectorized update: about O(x^(3/4)) work and
+    O(sqrt(x)) memory. The base primes come from the existing sieve.
+    """
+    if x < 2:
+        return 0
+    if x >= 2**63:
+        raise ValueError(f"prime_pi works on 64-bit signed integers, got {x}")
+    r = math.isqrt(x)
+    # small[v] = S(v) for v <= r, large[k] = S(x // k) for 1 <= k <= r
+    small = np.arange(-1, r, dtype=np.int64)
+    small[0] = 0
+    large = np.zeros(r + 1, dtype=np.int64)
+    large[1:] = x // np.arange(1, r + 1, dtype=np.int64) - 1
+    for p in base_primes(x):
+        sp = small[p - 1]
+        p2 = p * p
+        # x // k >= p^2 only for k <= x // p^2
+        last = min(r, x // p2)
+        # For k * p <= r, x // (k * p) is another "large" value; past that it is a small one
+        split = min(last, r // p)
+        large[1:split + 1] -= large[p:split * p + 1:p] - sp
+        if last > split:
+            k = np.arange(split + 1, last + 1, dtype=np.int64)
+            large[split + 1:last + 1] -= small[x // (k * p)] - sp
+        if p2 <= r:
+            small[p2:] -= small[np.arange(p2, r + 1, dtype=np.int64) // p] - sp
+    return int(large[1])
+
+# ------------------------------- PRIMALITY TESTING -------------------------------
+
+# Trial-division primes, taken from the sieve; anything below SMALL_LIMIT is decided by them alone
+SMALL_LIMIT = 1000
+SMALL_PRIMES = sieve_of_eratosthenes(SMALL_LIMIT)
+
+# Miller-Rabin with the first twelve primes as bases has no strong pseudoprime
+# below this bound (Sorenson and Webster, 2015), which covers every 64-bit integer
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+MILLER_RABIN_LIMIT = 318665857834031151167461
+
+def is_prime(n):
+    """
+    Return True if n is prime, deterministically for every n below MILLER_RABIN_LIMIT.
+
+    Small factors are removed by trial division, then n - 1 = d * 2^s and n
+    must pass the strong probable-prime test to every base in
+    MILLER_RABIN_BASES: O(log^3 n) bit operations, no sieve up to n.
+    """
+    if n >= MILLER_RABIN_LIMIT:
+        raise ValueError(f"Deterministic Miller-Rabin only covers n < {MILLER_RABIN_LIMIT}, got {n}")
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_LIMIT * SMALL_LIMIT:
+        return True
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MILLER_RABIN_BASES:
+        y = pow(a, d, n)
+        if y == 1 or y == n - 1:
+            continue
+        for _ in range(s - 1):
+            y = y * y % n
+            if y == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def next_prime(n):
+    """Return the smallest prime >= n."""
+    if n <= 2:
+        return 2
+    n |= 1
+    while not is_prime(n):
+        n += 2
+    return n
@@ -0,0 +1,127 @@
+import os
+import time
+import pickle
+import marshal
+import cProfile
+import pstats
+import concurrent.futures
+
+# ------------------------------- MULTI-PROCESS PROFILING -------------------------------
+
+# Worker wrapper: profiles one task inside the worker process and sends the
+# marshalled pstats data back together with timestamps for the IPC breakdown
+def profiled_task(job):
+    func, task = job
+    started = time.time()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    result = func(task)
+    profiler.disable()
+    finished = time.time()
+    profiler.create_stats()
+    # Pickle the result once here to see what returning it costs
+    pickle_start = time.perf_counter()
+    result_bytes = len(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+    pickle_time = time.perf_counter() - pickle_start
+    record = {
+        "pid": os.getpid(),
+        "started": started,
+        "finished": finished,
+        "pickle_time": pickle_time,
+        "result_bytes": result_bytes,
+        "stats": marshal.dumps(profiler.stats),
+    }
+    return result, record
+
+def stats_from_blob(blob):
+    """Rebuild a pstats.Stats object from a marshalled stats dict."""
+    stats = pstats.Stats()
+    stats.stats = marshal.loads(blob)
+    stats.get_top_level_stats()
+    return stats
+
+def hot_functions(stats, limit=10):
+    """Return the most expensive functions of stats, by cumulative time, as table columns."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return {
+        "Function": [pstats.func_std_string(func) for func, _ in rows],
+        "Calls": [nc for _, (cc, nc, tt, ct, callers) in rows],
+        "Total Time (s)": [f"{tt:.6f}" for _, (cc, nc, tt, ct, callers) in rows],
+        "Cumulative Time (s)": [f"{ct:.6f}" for _, (cc, nc, tt, ct, callers) in rows],
+    }
+
+class ParallelProfile:
+    """
+    Collects cProfile data from every worker process of a parallel run.
+
+    Pass an instance as `profile` to parallel_sieve or parallel_fibonacci.
+    Afterwards `per_worker` maps each worker pid to its merged pstats.Stats,
+    `combined()` merges all of them, and `tasks` holds one timing row per task
+    splitting its wall time into dispatch, compute, pickling and return.
+    """
+
+    def __init__(self):
+        self.per_worker = {}
+        self.tasks = []
+
+    def run(self, func, tasks, workers, executor=None):
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                return self.run(func, tasks, workers, executor)
+        done_times = {}
+        submitted = []
+        for task in tasks:
+            task_bytes = len(pickle.dumps((func, task), pickle.HIGHEST_PROTOCOL))
+            submit_time = time.time()
+            future = executor.submit(profiled_task, (func, task))
+            future.add_done_callback(lambda f: done_times.setdefault(f, time.time()))
+            submitted.append((submit_time, task_bytes, future))
+
+        results = []
+        for i, (submit_time, task_bytes, future) in enumerate(submitted):
+            result, record = future.result()
+            # The done callback may not have fired yet when result() returns
+            done_time = done_times.setdefault(future, time.time())
+            results.append(result)
+            stats = stats_from_blob(record["stats"])
+            if record["pid"] in self.per_worker:
+                self.per_worker[record["pid"]].add(stats)
+            else:
+                self.per_worker[record["pid"]] = stats
+            self.tasks.append({
+                "Task": i,
+                "Worker PID": record["pid"],
+                "Dispatch (s)": record["started"] - submit_time,
+                "Compute (s)": record["finished"] - record["started"],
+                "Result Pickling (s)": record["pickle_time"],
+                "Return (s)": done_time - record["finished"],
+                "Task Size (bytes)": task_bytes,
+                "Result Size (bytes)": record["result_bytes"],
+            })
+        return results
+
+    def combined(self):
+        """Merge the stats of every worker into one pstats.Stats."""
+        combined = pstats.Stats()
+        for stats in self.per_worker.values():
+            combined.add(stats)
+        return combined
+
+    def ipc_summary(self):
+        """Return total seconds spent per phase across all tasks."""
+        phases = ["Dispatch", "Compute", "Result Pickling", "Return"]
+        return {phase: sum(task[f"{phase} (s)"] for task in self.tasks) for phase in phases}
+
+    def bytes_moved(self):
+        """Return the pickled bytes sent to and received from the workers across all tasks."""
+        return sum(task["Task Size (bytes)"] + task["Result Size (bytes)"] for task in self.tasks)
+
+def measure_bytes_moved(func, *args):
+    """
+    Run a parallel function once under a ParallelProfile and return its bytes_moved().
+
+    This is its own run, so the extra pickling never lands in a timed measurement.
+    """
+    profile = ParallelProfile()
+    func(*args, profile=profile)
+    return profile.bytes_moved()
@@ -0,0 +1,173 @@
+import os
+import shutil
+import struct
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from sieve import parallel_sieve_bitmap
+
+# ------------------------------- PRIME BITMAP INDEX -------------------------------
+#
+# The index is an odd-only bitset: bit i (little-endian within each byte) is set
+# when 2i + 1 is prime, so every byte covers 16 consecutive numbers. It lives in
+# two files that are opened with mmap, so several processes share one copy:
+#   <path>         header (magic, limit, block size) followed by the bitset
+#   <path>.counts  uint64 popcount checkpoints, counts[j] = primes among the
+#                  odd numbers stored in the first j * block bytes
+# Both are written under temporary names and renamed into place, so a reader
+# never sees a half-written index.
+
+MAGIC = b"PRIMEBM1"
+HEADER = struct.Struct("<8sQQ")
+BLOCK_BYTES = 64
+
+# Number of set bits in every possible byte value
+POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# One build or extension at a time: Streamlit sessions asking for different limits share the files
+_index_lock = threading.RLock()
+
+def _counts_path(path):
+    return path.with_name(path.name + ".counts")
+
+def _temporary_path(path):
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+def _publish(temporary, path):
+    """Move a finished temporary index into place."""
+    # Counts first: new counts cover everything the old bitmap does, with the same
+    # checkpoints, while the new bitmap must never be seen without its counts
+    os.replace(_counts_path(temporary), _counts_path(path))
+    os.replace(temporary, path)
+
+def read_index_limit(path):
+    """Return the limit covered by the index stored at path."""
+    with open(path, "rb") as f:
+        magic, limit, _ = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a prime bitmap index")
+    return limit
+
+def _write_bitmap(f, start, limit, workers):
+    """Sieve [start, limit] with the segmented parallel engine and write the bits at f's position."""
+    for chunk in parallel_sieve_bitmap(start, limit, workers):
+        f.write(chunk)
+
+def _write_counts(path, first_block=0, previous=None):
+    """Compute popcount checkpoints for the index at path, taking those before first_block from `previous`."""
+    bits = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.size)
+    counts_path = _counts_path(path)
+    if first_block:
+        kept = np.fromfile(_counts_path(previous), dtype="<u8", count=first_block + 1)
+    else:
+        kept = np.zeros(1, dtype="<u8")
+    tail = bits[first_block * BLOCK_BYTES:]
+    padded = np.zeros(-(-len(tail) // BLOCK_BYTES) * BLOCK_BYTES, dtype=np.uint8)
+    padded[:len(tail)] = tail
+    block_counts = POPCOUNT[padded].reshape(-1, BLOCK_BYTES).sum(axis=1, dtype=np.uint64)
+    counts = np.concatenate((kept, kept[-1] + np.cumsum(block_counts, dtype=np.uint64)))
+    counts.astype("<u8").tofile(counts_path)
+    del bits
+
+def build_prime_index(path, limit, workers=1):
+    """Sieve every number up to limit and write a fresh index to path."""
+    if limit < 2:
+        raise ValueError(f"Prime index limit must be at least 2, got {limit}")
+    path = Path(path)
+    with _index_lock:
+        temporary = _temporary_path(path)
+        with open(temporary, "wb") as f:
+            f.write(HEADER.pack(MAGIC, limit, BLOCK_BYTES))
+            _write_bitmap(f, 0, limit, workers)
+        _write_counts(temporary)
+        _publish(temporary, path)
+
+def extend_prime_index(path, limit, workers=1):
+    """
+    Grow the index at path so that it covers limit.
+
+    Only the numbers past the old limit are sieved: the last, partially
+    covered byte is recomputed and new bytes are appended, then the
+    checkpoints are refreshed from the first block that changed. The work
+    happens on a copy, so indexes already open keep reading the old files.
+    """
+    path = Path(path)
+    with _index_lock:
+        old_limit = read_index_limit(path)
+        if limit <= old_limit:
+            return
+        complete_bytes = (old_limit + 1) // 16
+        temporary = _temporary_path(path)
+        shutil.copyfile(path, temporary)
+        with open(temporary, "r+b") as f:
+            f.write(HEADER.pack(MAGIC, limit, BLOCK_BYTES))
+            f.seek(HEADER.size + complete_bytes)
+            _write_bitmap(f, complete_bytes * 16, limit, workers)
+        _write_counts(temporary, complete_bytes // BLOCK_BYTES, previous=path)
+        _publish(temporary, path)
+
+def open_prime_index(path, limit, workers=1):
+    """Open the index at path, building or extending it first if it does not cover limit."""
+    path = Path(path)
+    with _index_lock:
+        if not path.exists():
+            build_prime_index(path, limit, workers)
+        elif read_index_limit(path) < limit:
+            extend_prime_index(path, limit, workers)
+        return PrimeIndex(path)
+
+class PrimeIndex:
+    """Read-only, memory-mapped view of a prime bitmap index."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.limit = read_index_limit(self.path)
+        size = ((self.limit + 1) // 2 + 7) // 8
+        self._bits = np.memmap(self.path, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(size,))
+        self._counts = np.memmap(_counts_path(self.path), dtype="<u8", mode="r")
+
+    def _check(self, n):
+        if n > self.limit:
+            raise ValueError(f"{n} is beyond the index limit {self.limit}")
+
+    def is_prime(self, n):
+        """Return True if n is prime, in O(1)."""
+        self._check(n)
+        if n < 3:
+            return n == 2
+        if n % 2 == 0:
+            return False
+        i = n // 2
+        return bool(self._bits[i >> 3] >> (i & 7) & 1)
+
+    def prime_count(self, x):
+        """Return pi(x), the number of primes <= x, from the nearest checkpoint."""
+        self._check(x)
+        if x < 2:
+            return 0
+        # Odd numbers <= x occupy bits [0, bit_end)
+        bit_end = (x + 1) // 2
+        byte_end, rem = divmod(bit_end, 8)
+        block = byte_end // BLOCK_BYTES
+        count = int(self._counts[block])
+        count += int(POPCOUNT[self._bits[block * BLOCK_BYTES:byte_end]].sum(dtype=np.uint64))
+        if rem:
+            count += int(self._bits[byte_end] & ((1 << rem) - 1)).bit_count()
+        return count + 1  # the prime 2 is not stored in the odd-only bitset
+
+    def primes_in_range(self, a, b):
+        """Return the primes in the half-open range [a, b) as a NumPy array."""
+        self._check(b - 1)
+        a = max(a, 0)
+        if b <= a:
+            return np.array([], dtype=np.int64)
+        first_bit, last_bit = a // 2, (b - 1) // 2
+        first_byte = first_bit // 8
+        bits = np.unpackbits(self._bits[first_byte:last_bit // 8 + 1], bitorder="little")
+        odd = 2 * (np.flatnonzero(bits).astype(np.int64) + first_byte * 8) + 1
+        odd = odd[(odd >= a) & (odd < b)]
+        if a <= 2 < b:
+            odd = np.concatenate((np.array([2], dtype=np.int64), odd))
+        return odd
@@ -0,0 +1,143 @@
+import sys
+import pickle
+import threading
+from bisect import bisect_right
+from itertools import islice
+from pathlib import Path
+from collections import OrderedDict
+
+from fibonacci import fibonacci_sequence
+from sieve import iter_primes
+
+# ------------------------------- RESULT CACHE -------------------------------
+
+def _sizeof(value):
+    """Rough memory footprint of a cached result, in bytes."""
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value)
+    return sys.getsizeof(value)
+
+def _file_suffix(params):
+    return "-".join(f"{name}={value}" for name, value in params) + ".pkl"
+
+class ResultCache:
+    """
+    Cache of algorithm results keyed by (algorithm, backend, n, params).
+
+    The in-memory tier is an LRU bounded by the estimated size of its values:
+    storing past max_bytes evicts the least recently used entries. With a
+    directory every result is also pickled to disk, so it survives evictions
+    and restarts; that tier is bounded by max_disk_bytes the same way, the
+    least recently used files being deleted first. `covering` finds the
+    smallest cached n at or above the one asked for, so results that are
+    prefixes of a larger one (F(0) .. F(n), a page of the primes up to n)
+    can be sliced from it instead of being recomputed.
+    """
+
+    def __init__(self, max_bytes=64 * 2**20, directory=None, max_disk_bytes=2**30):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries = OrderedDict()
+        # One cache is shared by every Streamlit session, each on its own thread
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, algorithm, backend, n, params):
+        return self.directory / f"{algorithm}-{backend}-{n}-{_file_suffix(params)}"
+
+    def _remember(self, key, value):
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.size -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+
+    def store(self, algorithm, backend, n, value, params=()):
+        params = tuple(sorted(params))
+        with self._lock:
+            self._remember((algorithm, backend, n, params), value)
+            if self.directory is not None:
+                with open(self._path(algorithm, backend, n, params), "wb") as f:
+                    pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+                self._trim_disk()
+
+    def _trim_disk(self):
+        """Delete the least recently used result files until the directory fits in max_disk_bytes."""
+        files = sorted((path.stat().st_mtime, path.stat().st_size, path) for path in self.directory.glob("*.pkl"))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _cached_ns(self, algorithm, backend, params):
+        ns = {key[2] for key in self._entries if key[:2] == (algorithm, backend) and key[3] == params}
+        if self.directory is not None:
+            prefix, suffix = f"{algorithm}-{backend}-", f"-{_file_suffix(params)}"
+            for path in self.directory.glob(f"{prefix}*{suffix}"):
+                n = path.name[len(prefix):-len(suffix)]
+                if n.isdigit():
+                    ns.add(int(n))
+        return ns
+
+    def covering(self, algorithm, backend, n, params=()):
+        """
+        Return (cached n, value) for the smallest cached n' >= n, or None.
+        """
+        params = tuple(sorted(params))
+        with self._lock:
+            candidates = [cached_n for cached_n in self._cached_ns(algorithm, backend, params) if cached_n >= n]
+            if not candidates:
+                self.misses += 1
+                return None
+            self.hits += 1
+            cached_n = min(candidates)
+            key = (algorithm, backend, cached_n, params)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return cached_n, self._entries[key][0]
+            path = self._path(algorithm, backend, cached_n, params)
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            # The modification time orders the disk tier for eviction
+            path.touch()
+            self._remember(key, value)
+            return cached_n, value
+
+def cached_fibonacci_sequence(cache, n):
+    """Return [F(0), ..., F(n)], sliced from a cached longer sequence when there is one."""
+    found = cache.covering("fibonacci_sequence", "python", n)
+    if found is None:
+        sequence = fibonacci_sequence(n)
+        cache.store("fibonacci_sequence", "python", n, sequence)
+        return sequence
+    return found[1][:n + 1]
+
+def cached_prime_page(cache, first, limit, size):
+    """
+    Return the first `size` primes in [first, limit], sliced from a cached page for a larger limit when there is one.
+
+    The page for a larger limit starts with the same primes, so the ones up to
+    limit are the answer, without sieving again.
+    """
+    params = (("first", first), ("size", size))
+    found = cache.covering("prime_page", "segmented", limit, params)
+    if found is None:
+        page = list(islice(iter_primes(first, limit + 1), size))
+        cache.store("prime_page", "segmented", limit, page, params)
+        return page
+    page = found[1]
+    return page[:bisect_right(page, limit)]
@@ -0,0 +1,166 @@
+import os
+import time
+import concurrent.futures
+
+from worker_pool import map_tasks
+
+# ------------------------------- CHUNK SCHEDULING -------------------------------
+
+SCHEDULES = ("static", "adaptive")
+
+# The remaining work is always split over at least this many tasks per worker, so the last tasks shrink
+TAIL_TASKS_PER_WORKER = 2
+
+# Tasks per worker the adaptive schedule starts with, before any task has been measured
+INITIAL_TASKS_PER_WORKER = 8
+
+def static_ranges(start, end, workers):
+    """Split [start, end) into one equal range per worker, the remainder going to the last one."""
+    size = (end - start) // workers
+    ranges = [(start + i * size, start + (i + 1) * size) for i in range(workers)]
+    ranges[-1] = (ranges[-1][0], end)
+    return ranges
+
+# Worker wrapper: runs one task and reports where and when it ran
+def timed_task(job):
+    func, task = job
+    started = time.time()
+    result = func(task)
+    return result, os.getpid(), started, time.time()
+
+class ChunkScheduler:
+    """
+    Splits a range [start, end) into tasks and feeds them to a process pool as workers free up.
+
+    The "static" schedule makes one equal task per worker, like the plain
+    split. The "adaptive" one starts with small tasks, measures the seconds
+    per unit of every finished task and sizes the next ones to take about
+    `target_seconds`. A task never takes more than the remaining work split
+    over TAIL_TASKS_PER_WORKER * workers, so the last tasks shrink and no
+    single straggler sets the total time. At most `workers` tasks are in
+    flight, so a run never occupies more processes than it asked for, even
+    on a larger shared executor; each finished task frees its slot for the
+    next one.
+
+    Results arrive in completion order (kept in `completion_order`) and are
+    reassembled by position. After run(), `tasks` holds one row per task and
+    worker_utilization() the busy share of every worker over the run.
+    """
+
+    def __init__(self, schedule="adaptive", target_seconds=0.1, min_size=1):
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Unknown schedule: {schedule!r}, expected one of {SCHEDULES}")
+        self.schedule = schedule
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.tasks = []
+        self.completion_order = []
+        self.wall_time = 0.0
+        self._initial_size = min_size
+        self._seconds_per_unit = None
+
+    def _next_size(self, remaining, workers):
+        tail_tasks = TAIL_TASKS_PER_WORKER * workers
+        if self._seconds_per_unit:
+            size = int(self.target_seconds / self._seconds_per_unit)
+        else:
+            size = self._initial_size
+        return max(self.min_size, min(size, -(-remaining // tail_tasks)))
+
+    def _ranges(self, start, end, workers):
+        """Yield the next (low, high) range each time it is asked for, sized from the latest measurement."""
+        if self.schedule == "static":
+            yield from static_ranges(start, end, workers)
+            return
+        low = start
+        while low < end:
+            high = min(end, low + self._next_size(end - low, workers))
+            yield low, high
+            low = high
+
+    def run(self, func, make_task, start, end, workers, executor=None, progress=None):
+        """
+        Run func(make_task(low, high)) over [start, end) and return the results in range order.
+
+        `progress(done, total)` is called with the units finished so far as each task completes.
+        """
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                return self.run(func, make_task, start, end, workers, executor, progress)
+        self.tasks = []
+        self.completion_order = []
+        self._seconds_per_unit = None
+        self._initial_size = max(self.min_size, (end - start) // (workers * INITIAL_TASKS_PER_WORKER))
+        run_start = time.time()
+        ranges = self._ranges(start, end, workers)
+        pending = {}
+        results = {}
+        done = 0
+
+        def submit_next():
+            next_range = next(ranges, None)
+            if next_range is None:
+                return False
+            index = len(self.tasks)
+            self.tasks.append({"Task": index, "Start": next_range[0], "End": next_range[1]})
+            pending[executor.submit(timed_task, (func, make_task(*next_range)))] = index
+            return True
+
+        while len(pending) < workers and submit_next():
+            pass
+        while pending:
+            finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                index = pending.pop(future)
+                result, pid, started, stopped = future.result()
+                results[index] = result
+                self.completion_order.append(index)
+                row = self.tasks[index]
+                size = row["End"] - row["Start"]
+                row.update({
+                    "Worker PID": pid,
+                    "Started (s)": started - run_start,
+                    "Finished (s)": stopped - run_start,
+                    "Compute (s)": stopped - started,
+                })
+                # The most recent task sits closest to the work still ahead, so its cost predicts best
+                if size and stopped > started:
+                    self._seconds_per_unit = (stopped - started) / size
+                done += size
+                if progress is not None:
+                    progress(done, end - start)
+            while len(pending) < workers and submit_next():
+                pass
+        self.wall_time = time.time() - run_start
+        return [results[index] for index in range(len(self.tasks))]
+
+    def worker_utilization(self):
+        """Return one row per worker with its task count, busy seconds and busy share of the run's wall time."""
+        busy = {}
+        counts = {}
+        for row in self.tasks:
+            pid = row["Worker PID"]
+            busy[pid] = busy.get(pid, 0.0) + row["Compute (s)"]
+            counts[pid] = counts.get(pid, 0) + 1
+        return [{
+            "Worker PID": pid,
+            "Tasks": counts[pid],
+            "Busy (s)": busy[pid],
+            "Utilization": busy[pid] / self.wall_time if self.wall_time else 0.0,
+        } for pid in sorted(busy)]
+
+def dispatch_range(func, make_task, start, end, workers, executor=None, profile=None, progress=None, scheduler=None):
+    """
+    Run func over tasks covering [start, end) and return their results in range order.
+
+    Without a scheduler the range is split statically and sent through
+    map_tasks; with a ChunkScheduler that scheduler decides the task sizes
+    and records per-task timings. A ParallelProfile needs every task up
+    front, so it only works with the static split.
+    """
+    if scheduler is None:
+        tasks = [make_task(low, high) for low, high in static_ranges(start, end, workers)]
+        return map_tasks(func, tasks, workers, executor, profile, progress)
+    if profile is not None:
+        raise ValueError("Profiling runs use the static split; pass either a profile or a scheduler")
+    return scheduler.run(func, make_task, start, end, workers, executor, progress)
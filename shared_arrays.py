@@ -0,0 +1,98 @@
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+try:
+    import numpy as np
+except ImportError:
+    # Only the "shared_memory" transport needs this module; callers check np first
+    np = None
+
+# ------------------------------- SHARED MEMORY RESULTS -------------------------------
+
+# How parallel workers hand their results back: pickled through the pool's
+# pipes, or written in place into a block of shared memory the parent allocated
+TRANSPORTS = ("pickle", "shared_memory")
+
+def check_transport(transport):
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport: {transport!r}, expected one of {TRANSPORTS}")
+    if transport == "shared_memory" and np is None:
+        raise ImportError("The 'shared_memory' transport needs NumPy, which is not installed")
+
+class SharedArray:
+    """
+    A NumPy array living in a shared memory block owned by the parent process.
+
+    Workers get `spec`, a small picklable (name, shape, dtype) tuple, attach
+    to the block with attach_shared and write their part in place, so only
+    the spec crosses the process boundary instead of the data. Use it as a
+    context manager: the block is released and unlinked on exit, so take
+    whatever the caller needs out of `array` before leaving the block.
+    """
+
+    def __init__(self, shape, dtype):
+        self.shape = shape if isinstance(shape, tuple) else (shape,)
+        self.dtype = np.dtype(dtype)
+        nbytes = self.dtype.itemsize
+        for length in self.shape:
+            nbytes *= length
+        # A zero-sized block cannot be created, but an empty view over one byte is fine
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        self.array = np.ndarray(self.shape, self.dtype, buffer=self._shm.buf)
+
+    @property
+    def spec(self):
+        return self._shm.name, self.shape, self.dtype.str
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+    def close(self):
+        # The view must go before the mapping can be closed
+        self.array = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Per process id: whether that process runs a resource tracker of its own
+_own_tracker = {}
+
+def _has_own_tracker():
+    """
+    Return True if this process started its own resource tracker instead of sharing its parent's.
+
+    Spawned and forkserver workers get the parent's tracker passed in, and so
+    does a worker forked while the parent's tracker was running. Only a worker
+    forked before that, like a pool warmed up before the first SharedArray,
+    starts a tracker of its own on its first attach. Call before attaching.
+    """
+    pid = os.getpid()
+    if pid not in _own_tracker:
+        _own_tracker[pid] = resource_tracker._resource_tracker._fd is None
+    return _own_tracker[pid]
+
+def attach_shared(spec):
+    """
+    Attach to the SharedArray described by spec and return (block, array view).
+
+    Drop every reference to the view before calling block.close().
+    """
+    name, shape, dtype = spec
+    if sys.version_info >= (3, 13):
+        block = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        own_tracker = _has_own_tracker()
+        block = shared_memory.SharedMemory(name=name)
+        # Attaching registers the block with this worker's resource tracker. A tracker
+        # of its own would unlink the block when the worker exits, but the parent owns
+        # it; in the parent's shared tracker, unregistering would drop the parent's entry
+        if own_tracker:
+            resource_tracker.unregister(block._name, "shared_memory")
+    return block, np.ndarray(shape, dtype, buffer=block.buf)
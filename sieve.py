@@ -0,0 +1,285 @@
+import math
+import concurrent.futures
+from collections import deque
+from itertools import compress
+
+try:
+    import numpy as np
+except ImportError:
+    # Interpreters such as PyPy or a bare Nuitka build may lack NumPy; the
+    # reference "python" backend and the segmented engine still work there
+    np = None
+
+from shared_arrays import SharedArray, attach_shared, check_transport
+from scheduler import dispatch_range
+
+# Size of one sieving window, in candidates. 32 KiB keeps the working buffer
+# inside a typical L1/L2 data cache while the base primes stream over it.
+SEGMENT_SIZE = 1 << 15
+
+# Numbers handed to a worker per task when building a bitmap in parallel
+BITMAP_WINDOW = 1 << 24
+
+# Numbers handed to a worker per task when streaming primes in parallel
+STREAM_WINDOW = 1 << 20
+
+# ------------------------------- SIEVE OF ERATOSTHENES FUNCTIONS -------------------------------
+
+SIEVE_BACKENDS = ("python", "bytearray", "numpy")
+
+def sieve_of_eratosthenes(limit, backend="python"):
+    """
+    Return the primes up to and including limit.
+
+    The "python" backend is the reference list-of-bools implementation and
+    returns a list. The "bytearray" and "numpy" backends track odd numbers
+    only, clear composites with slice assignment and return a NumPy array.
+    """
+    if backend == "python":
+        return _sieve_python(limit)
+    if backend in SIEVE_BACKENDS and np is None:
+        raise ImportError(f"The {backend!r} sieve backend needs NumPy, which is not installed")
+    if backend == "bytearray":
+        return _sieve_bytearray(limit)
+    if backend == "numpy":
+        return _sieve_numpy(limit)
+    raise ValueError(f"Unknown sieve backend: {backend!r}, expected one of {SIEVE_BACKENDS}")
+
+# Normal Sieve of Eratosthenes
+def _sieve_python(limit):
+    primes = [True] * (limit + 1)
+    p = 2
+    while p * p <= limit:
+        if primes[p]:
+            for i in range(p * p, limit + 1, p):
+                primes[i] = False
+        p += 1
+    return [p for p in range(2, limit + 1) if primes[p]]
+
+# Odd-only sieve on a bytearray: index i stands for the number 2i + 1
+def _sieve_bytearray(limit):
+    if limit < 2:
+        return np.array([], dtype=np.int64)
+    size = (limit + 1) // 2
+    flags = bytearray(b"\x01") * size
+    flags[0] = 0
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes((size - 1 - start) // p + 1)
+    return _odd_flags_to_primes(np.frombuffer(flags, dtype=np.uint8))
+
+# Odd-only sieve on a boolean ndarray, same layout as the bytearray backend
+def _sieve_numpy(limit):
+    if limit < 2:
+        return np.array([], dtype=np.int64)
+    size = (limit + 1) // 2
+    flags = np.ones(size, dtype=bool)
+    flags[0] = False
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = False
+    return _odd_flags_to_primes(flags)
+
+def _odd_flags_to_primes(flags):
+    odd_primes = 2 * np.flatnonzero(flags).astype(np.int64) + 1
+    return np.concatenate((np.array([2], dtype=np.int64), odd_primes))
+
+# Base primes needed to sieve every number up to limit
+def base_primes(limit):
+    return sieve_of_eratosthenes(math.isqrt(limit))
+
+# ------------------------------- SEGMENTED SIEVE ENGINE -------------------------------
+
+def _sieve_window(low, high, primes):
+    """Return a bytearray of prime flags for the numbers in [low, high)."""
+    size = high - low
+    segment = bytearray(b"\x01") * size
+    # 0 and 1 are not prime
+    for n in range(low, min(2, high)):
+        segment[n - low] = 0
+    for p in primes:
+        if p * p >= high:
+            break
+        # First multiple of p inside the window, never p itself
+        first = max(p * p, -(-low // p) * p) - low
+        if first < size:
+            segment[first::p] = bytes((size - 1 - first) // p + 1)
+    return segment
+
+def sieve_segment(start, end, primes, segment_size=SEGMENT_SIZE, progress=None):
+    """
+    Return the primes in the half-open window [start, end).
+
+    `primes` must contain every prime up to sqrt(end - 1). The window is
+    processed in fixed-size buffers of `segment_size` candidates, so memory
+    stays constant no matter how wide the window is. `progress(done, total)`
+    is called with the numbers sieved so far after every buffer.
+    """
+    result = []
+    low = start
+    while low < end:
+        high = min(low + segment_size, end)
+        result.extend(compress(range(low, high), _sieve_window(low, high, primes)))
+        low = high
+        if progress is not None:
+            progress(high - start, end - start)
+    return result
+
+# Single-process segmented sieve of [0, limit], reporting progress per segment
+def segmented_sieve(limit, progress=None):
+    if limit < 2:
+        return []
+    return sieve_segment(0, limit + 1, base_primes(limit), progress=progress)
+
+def sieve_segment_bitmap(start, end, primes, segment_size=SEGMENT_SIZE):
+    """
+    Return the odd-only prime bitmap of [start, end) as packed bytes.
+
+    Bit i of the result (little-endian within each byte) stands for the odd
+    number start + 2i + 1. `start` must be a multiple of 16 so that every
+    byte covers exactly 16 consecutive numbers.
+    """
+    if start % 16:
+        raise ValueError(f"Bitmap windows must start on a multiple of 16, got {start}")
+    chunks = []
+    low = start
+    while low < end:
+        high = min(low + segment_size, end)
+        flags = np.frombuffer(_sieve_window(low, high, primes), dtype=np.uint8)
+        chunks.append(np.packbits(flags[1::2], bitorder="little").tobytes())
+        low = high
+    return b"".join(chunks)
+
+# Worker function for parallel Sieve: sieves only its own [start, end) window
+def sieve_worker_task(task):
+    start, end, primes = task
+    return sieve_segment(start, end, primes)
+
+# Worker function for the shared-memory transport: writes the prime flags of
+# its window straight into the parent's array and only returns the window size
+def sieve_shared_worker_task(task):
+    start, end, primes, spec = task
+    block, flags = attach_shared(spec)
+    try:
+        low = start
+        while low < end:
+            high = min(low + SEGMENT_SIZE, end)
+            flags[low:high] = np.frombuffer(_sieve_window(low, high, primes), dtype=np.uint8)
+            low = high
+    finally:
+        del flags
+        block.close()
+    return end - start
+
+# Parallelized Sieve of Eratosthenes
+def parallel_sieve(limit, workers=2, executor=None, profile=None, transport="pickle", progress=None, scheduler=None):
+    """
+    Return the primes up to and including limit, sieved in worker processes.
+
+    With the "pickle" transport every worker sends its primes back as a list.
+    With "shared_memory" the workers fill one flag per number into a shared
+    array and the primes are read from it as a NumPy array, so nothing but
+    the window bounds and base primes crosses a pipe. `progress(done, total)`
+    is called as each worker's window comes back. By default there is one
+    window per worker; a ChunkScheduler passed as `scheduler` sizes and
+    feeds the windows instead.
+    """
+    check_transport(transport)
+    if limit < 2:
+        return [] if transport == "pickle" else np.array([], dtype=np.int64)
+    # Base primes are computed once here and shipped to every worker
+    primes = base_primes(limit)
+
+    if transport == "shared_memory":
+        with SharedArray(limit + 1, np.uint8) as flags:
+            dispatch_range(sieve_shared_worker_task, lambda start, end: (start, end, primes, flags.spec),
+                           0, limit + 1, workers, executor, profile, progress, scheduler)
+            return np.flatnonzero(flags.array)
+
+    results = dispatch_range(sieve_worker_task, lambda start, end: (start, end, primes),
+                             0, limit + 1, workers, executor, profile, progress, scheduler)
+    return [prime for sublist in results for prime in sublist]
+
+# Worker function for the parallel bitmap build
+def sieve_bitmap_worker_task(task):
+    start, end, primes = task
+    return sieve_segment_bitmap(start, end, primes)
+
+def parallel_sieve_bitmap(start, limit, workers=2, window=BITMAP_WINDOW, executor=None):
+    """
+    Yield the packed odd-only bitmap of [start, limit] window by window, in order.
+
+    `start` must be a multiple of 16 and `window` a multiple of 16, so the
+    yielded chunks can be concatenated byte for byte.
+    """
+    primes = base_primes(limit)
+    tasks = [(low, min(low + window, limit + 1), primes) for low in range(start, limit + 1, window)]
+    if executor is not None:
+        yield from executor.map(sieve_bitmap_worker_task, tasks)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(sieve_bitmap_worker_task, tasks)
+
+# ------------------------------- STREAMING PRIMES -------------------------------
+
+def _extend_base_primes(high, primes, bound):
+    """
+    Return (primes, bound) with base primes covering every number below high.
+
+    When the current bound falls short it is at least doubled, so an unbounded
+    stream re-sieves its base primes only O(log n) times.
+    """
+    needed = math.isqrt(high - 1)
+    if needed <= bound:
+        return primes, bound
+    bound = max(needed, 2 * bound)
+    return sieve_of_eratosthenes(bound), bound
+
+def iter_primes(start=2, stop=None, segment_size=SEGMENT_SIZE):
+    """
+    Yield the primes in [start, stop) in increasing order.
+
+    With stop=None the generator never ends. Only one window of
+    `segment_size` candidates and the base primes up to sqrt of its end are
+    alive at a time, so memory grows with sqrt(stop) instead of stop.
+    """
+    primes, bound = [], 1
+    low = max(start, 2)
+    while stop is None or low < stop:
+        high = low + segment_size if stop is None else min(low + segment_size, stop)
+        primes, bound = _extend_base_primes(high, primes, bound)
+        yield from compress(range(low, high), _sieve_window(low, high, primes))
+        low = high
+
+def parallel_iter_primes(start=2, stop=None, workers=2, window=STREAM_WINDOW, executor=None):
+    """
+    Yield the primes in [start, stop) as one list per window, in order.
+
+    Windows are sieved in worker processes with at most 2 * workers of them
+    in flight, so memory stays bounded even with stop=None. A window's list
+    is yielded as soon as it and every window before it have finished.
+    """
+    if executor is None:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from parallel_iter_primes(start, stop, workers, window, executor)
+        return
+    primes, bound = [], 1
+    low = max(start, 2)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < 2 * workers and (stop is None or low < stop):
+                high = low + window if stop is None else min(low + window, stop)
+                primes, bound = _extend_base_primes(high, primes, bound)
+                pending.append(executor.submit(sieve_worker_task, (low, high, primes)))
+                low = high
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        # A consumer that stops early must not leave windows queued on a shared pool
+        for future in pending:
+            future.cancel()
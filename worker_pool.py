@@ -0,0 +1,106 @@
+import os
+import time
+import threading
+import contextlib
+import concurrent.futures
+
+# ------------------------------- WORKER POOL -------------------------------
+
+def _collect(results, total, progress):
+    if progress is None:
+        return list(results)
+    collected = []
+    for result in results:
+        collected.append(result)
+        progress(len(collected), total)
+    return collected
+
+def map_tasks(func, tasks, workers, executor=None, profile=None, progress=None):
+    """
+    Run func over tasks in worker processes and return the results in order.
+
+    With an executor the tasks go to that long-lived pool; without one a
+    pool of `workers` processes is created for this call and torn down again.
+    A ParallelProfile passed as `profile` runs the tasks under cProfile
+    inside the workers and collects their stats. `progress(done, total)` is
+    called in this process as each task's result arrives, in order.
+    """
+    if profile is not None:
+        return profile.run(func, tasks, workers, executor)
+    if executor is not None:
+        return _collect(executor.map(func, tasks), len(tasks), progress)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return _collect(executor.map(func, tasks), len(tasks), progress)
+
+# Warm-up task: runs once per worker so process start-up and the imports of the
+# algorithm modules happen before anything is timed
+def _warm_up(_):
+    import fibonacci, sieve  # noqa: F401
+    time.sleep(0.05)
+    return os.getpid()
+
+class WorkerPool:
+    """
+    Warm ProcessPoolExecutors kept alive between runs, one per worker count.
+
+    Shared by every session, so a run leases the executor it needs with
+    lease() and no other session can shut it down while the run uses it.
+    A count nobody has leased recently is retired once more than `max_pools`
+    executors are alive. `startup_times` holds, per worker count, the cost of
+    starting that executor, spawn plus warm-up, so it can be reported apart
+    from the timings of the work sent to it.
+    """
+
+    def __init__(self, max_pools=4):
+        self.max_pools = max_pools
+        self.startup_times = {}
+        # Worker count -> executor, least recently leased first
+        self._executors = {}
+        self._leases = {}
+        self._lock = threading.Lock()
+
+    def is_warm(self, workers):
+        with self._lock:
+            return workers in self._executors
+
+    @contextlib.contextmanager
+    def lease(self, workers):
+        """Yield a warm executor with `workers` processes, kept alive until the run leaving this block ends."""
+        with self._lock:
+            executor = self._executors.pop(workers, None)
+            if executor is None:
+                start = time.perf_counter()
+                executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+                warm_up(executor, workers)
+                self.startup_times[workers] = time.perf_counter() - start
+            self._executors[workers] = executor
+            self._leases[workers] = self._leases.get(workers, 0) + 1
+        try:
+            yield executor
+        finally:
+            with self._lock:
+                self._leases[workers] -= 1
+                self._retire_idle()
+
+    def _retire_idle(self):
+        """Shut down the least recently leased idle executors beyond `max_pools`; call with the lock held."""
+        idle = [workers for workers in self._executors if not self._leases.get(workers)]
+        for workers in idle[:max(0, len(self._executors) - self.max_pools)]:
+            self._executors.pop(workers).shutdown(wait=True)
+            self.startup_times.pop(workers, None)
+
+    def shutdown(self):
+        with self._lock:
+            for executor in self._executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._executors.clear()
+            self.startup_times.clear()
+
+def warm_up(executor, workers):
+    """Give every worker a task so all processes exist and have imported the algorithms."""
+    pids = set()
+    for _ in range(3):
+        pids.update(executor.map(_warm_up, range(workers)))
+        if len(pids) >= workers:
+            break
+    return len(pids)